@@ -1,11 +1,31 @@
 from openai import OpenAI
 from io import BytesIO
-import tempfile
-import os
+from concurrent.futures import ThreadPoolExecutor
 import re
 
-from data_parser import structure_ai_response_data, get_schema_for_category
+from data_parser import structure_json_response_data, get_schema_for_category
 import json
+import orjson
+
+# Number of pages sent to the API at the same time, and how often the SDK retries a rate-limited request
+MAX_CONCURRENT_PAGE_REQUESTS = 16
+API_MAX_RETRIES = 5
+
+# Structured Outputs schema for the single classification + segment extraction call
+PAGE_CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "category": {
+            "type": "string",
+            "enum": ["Operational and Risk", "Financial Statement", "Debt and Loans", "Legal", "Other"]
+        },
+        "reasoning_points": {"type": "array", "items": {"type": "string"}},
+        "overall_focus": {"type": "string"},
+        "business_segment": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["category", "reasoning_points", "overall_focus", "business_segment"],
+    "additionalProperties": False
+}
 
 class PDFPageClassificationExample:
     def __init__(self, page_index, page_number, category, reasoning_points, overall_focus):
@@ -140,89 +160,40 @@ Here are examples of how to classify pages:
     for example in examples:
         prompt += example.to_prompt_format() + "\n\n"
     
-    prompt += """Now classify this page following the same format. Provide specific reasoning points and an overall focus statement.
+    prompt += """Now classify this page following the same reasoning. Provide specific reasoning points and an overall focus statement.
 
-Output: This page is part of the [CATEGORY] section for the following reasons:
-• [Specific reason 1]
-• [Specific reason 2]
-• [Additional reasons as needed]
-• Overall, [a summary of the page's focus]
-"""
-    
-    return prompt
-
-def build_schema_extraction_prompt(category: str):
-    """Builds a prompt to extract schema data for a given category."""
-    
-    # We can customize this later to include the full schema for the AI to fill out
-    # For now, we focus on the business segment as requested.
-    
-    prompt = f"""
-The provided page has been classified as '{category}'.
-
-Your task is to identify which business segment(s) the information on this page pertains to.
+Also identify which business segment(s) the information on this page pertains to.
 Business segments might be names like "Performance Coatings", "Industrial Coatings", "Global Architectural Coatings", or a consolidated name like "Total", "Consolidated", or "Corporate".
-
 If the page clearly relates to one or more specific segments, list them.
 If the page contains consolidated data for the entire company, use "Consolidated".
-If the page does not relate to any specific business segment (e.g., a table of contents), state "Not Applicable".
-
-Provide the output ONLY in the following format:
-BUSINESS SEGMENT: [Segment Name 1], [Segment Name 2]
-
-Example 1:
-BUSINESS SEGMENT: Performance Coatings
+If the page does not relate to any specific business segment (e.g., a table of contents) or is classified as 'Other', leave the list empty.
 
-Example 2:
-BUSINESS SEGMENT: Consolidated"""
+Return the category, reasoning points, overall focus and business segments in the requested JSON format.
+"""
     
     return prompt
 
-def page_type_selection(pages_with_indices: list[tuple[int, BytesIO]], client: OpenAI):
-    '''
-    Function that is given an array of PDF pages as a BytesIO objects.
-    
-    It analyses each page and classifies it into different types such as:
-        - Operational and Risk
-        - Financial Statement 
-        - Debt and Loans
-        - Legal
-        - Other
-        
-    Uses few-shot learning with examples to improve classification accuracy.
-    Returns two separate dictionaries: classifications and raw AI responses.
-    '''
+# The examples and template are static, so the prompt is built once at import
+CLASSIFICATION_PROMPT = build_classification_prompt(get_classification_examples(num_examples=6))
 
-    # Get few-shot learning examples
-    examples = get_classification_examples(num_examples=6)
-    classification_prompt = build_classification_prompt(examples)
+def _upload_pdf_page(client: OpenAI, pdf_page: BytesIO):
+    """Uploads an in-memory PDF page to OpenAI without writing it to disk."""
+    return client.files.create(
+        file=("page.pdf", pdf_page.getvalue(), "application/pdf"),
+        purpose="user_data"
+    )
 
-    page_classification = {}
-    raw_responses = {}
-    schema_response_text = "" # Initialize schema response text
+def _classify_page(client: OpenAI, classification_prompt: str, original_index: int, pdf_page: BytesIO):
+    '''
+    Classifies a single PDF page and extracts its business segment(s).
 
-    for original_index, pdf_page in pages_with_indices:
-        # Reset BytesIO position to beginning
-        pdf_page.seek(0)
-        
-        # Save BytesIO to a temporary file with proper PDF extension
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-            temp_file.write(pdf_page.read())
-            temp_file_path = temp_file.name
-        
-        # --- Step 1: Classification Call ---
-        try:
-            # Upload the temporary file to OpenAI
-            with open(temp_file_path, 'rb') as f:
-                file = client.files.create(
-                    file=f,
-                    purpose="user_data"
-                )
-        finally:
-            # We will reuse the temp file for the second call
-            pass
-
-        classification_response = client.responses.create(
+    Returns a tuple of (original_index, structured_data, raw_response).
+    '''
+    file = _upload_pdf_page(client, pdf_page)
+
+    # A single call returns both the classification and the business segment(s)
+    try:
+        response = client.responses.create(
             model="gpt-4o",
             input=[
                 {
@@ -238,56 +209,78 @@ def page_type_selection(pages_with_indices: list[tuple[int, BytesIO]], client: O
                         },
                     ]
                 }
-            ]
+            ],
+            text={
+                "format": {
+                    "type": "json_schema",
+                    "name": "page_cls",
+                    "schema": PAGE_CLASSIFICATION_SCHEMA,
+                    "strict": True
+                }
+            }
         )
+    finally:
+        # Don't leave the uploaded page in the account's file storage
+        client.files.delete(file.id)
+
+    response_text = response.output_text.strip()
+    # Truncated or refused responses are logged here; their (invalid or empty) JSON is classified as 'Other'
+    if response.status != "completed":
+        print(f"Page {original_index + 1} (index {original_index}): response {response.status}: {response.incomplete_details}")
+    refusals = [
+        content.refusal
+        for item in response.output if item.type == "message"
+        for content in item.content if content.type == "refusal"
+    ]
+    if refusals:
+        print(f"Page {original_index + 1} (index {original_index}): model refused: {' '.join(refusals)}")
+    # Print progress update
+    print(f"Page {original_index + 1} (index {original_index}): Classification complete.")
+
+    structured_data = structure_json_response_data(response_text)
+    structured_data['page_number'] = original_index + 1
+
+    raw_response = {
+        'page_number': original_index + 1,
+        'classification_text': response_text,
+        'length': len(response_text)
+    }
+
+    return original_index, structured_data, raw_response
 
-        classification_response_text = classification_response.output_text.strip()
-        # Print progress update
-        print(f"Page {original_index + 1} (index {original_index}): Classification complete.")
-
-        # Temporarily parse to get the category for the next step
-        temp_structured_data = structure_ai_response_data(classification_response_text)
-        page_category = temp_structured_data['category']
-
-        # --- Step 2: Schema Data Extraction Call ---
-        if page_category != 'Other':
-            schema_prompt = build_schema_extraction_prompt(page_category)
-            try:
-                # Re-upload the same file if needed, or reuse file_id if API allows
-                with open(temp_file_path, 'rb') as f:
-                    file_for_schema = client.files.create(file=f, purpose="user_data")
-
-                schema_response = client.responses.create(
-                    model="gpt-4o",
-                    input=[{"role": "user", "content": [{"type": "input_file", "file_id": file_for_schema.id}, {"type": "input_text", "text": schema_prompt}]}]
-                )
-                schema_response_text = schema_response.output_text.strip()
-                print(f"Page {original_index + 1} (index {original_index}): Schema data extraction complete.")
-
-            except Exception as e:
-                print(f"Error during schema extraction on page {original_index + 1}: {e}")
-                schema_response_text = "" # Ensure it's empty on error
-        else:
-            schema_response_text = "" # No schema extraction for 'Other'
-
-        # Clean up the temporary file after both calls are done
-        os.unlink(temp_file_path)
-
-        # --- Step 3: Final Structuring ---
-        # Now structure the final object using both AI responses
-        structured_data = structure_ai_response_data(classification_response_text, schema_response_text)
-        
-        # Store the structured classification results. The parser now returns the exact format we need.
-        page_classification[original_index] = structured_data
-        page_classification[original_index]['page_number'] = original_index + 1
+def page_type_selection(pages_with_indices: list[tuple[int, BytesIO]], client: OpenAI):
+    '''
+    Function that is given an array of PDF pages as a BytesIO objects.
+    
+    It analyses each page and classifies it into different types such as:
+        - Operational and Risk
+        - Financial Statement 
+        - Debt and Loans
+        - Legal
+        - Other
         
-        # Store raw AI response separately
-        raw_responses[original_index] = {
-            'page_number': original_index + 1,
-            'classification_text': classification_response_text,
-            'schema_text': schema_response_text,
-            'length': len(classification_response_text) + len(schema_response_text)
-        }
+    Uses few-shot learning with examples to improve classification accuracy.
+    Pages are processed concurrently (up to MAX_CONCURRENT_PAGE_REQUESTS at a time),
+    since each page is dominated by API round-trip latency.
+    Returns two separate dictionaries: classifications and raw AI responses.
+    '''
+
+    # Let the SDK back off and retry on rate limits (429) raised by the concurrent requests
+    client = client.with_options(max_retries=API_MAX_RETRIES)
+
+    page_classification = {}
+    raw_responses = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGE_REQUESTS) as executor:
+        futures = [
+            executor.submit(_classify_page, client, CLASSIFICATION_PROMPT, original_index, pdf_page)
+            for original_index, pdf_page in pages_with_indices
+        ]
+        # Collect in submission order so the dictionaries keep the input page order
+        for future in futures:
+            original_index, structured_data, raw_response = future.result()
+            page_classification[original_index] = structured_data
+            raw_responses[original_index] = raw_response
     
     return page_classification, raw_responses
 
@@ -295,14 +288,8 @@ def _extract_details_with_json_prompt(pdf_page: BytesIO, client: OpenAI, prompt:
     """
     A generic helper function to call the AI with a JSON-based extraction prompt.
     """
-    pdf_page.seek(0)
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-        temp_file.write(pdf_page.read())
-        temp_file_path = temp_file.name
-    
     try:
-        with open(temp_file_path, 'rb') as f:
-            file = client.files.create(file=f, purpose="user_data")
+        file = _upload_pdf_page(client, pdf_page)
         
         response = client.responses.create(
             model="gpt-4o",
@@ -312,67 +299,53 @@ def _extract_details_with_json_prompt(pdf_page: BytesIO, client: OpenAI, prompt:
         # We need to parse this string.
         raw_text = response.output_text.strip()
         
-        # Clean the text: remove markdown code block fences if they exist
-        if raw_text.startswith("```json"):
-            raw_text = raw_text[7:]
-        if raw_text.endswith("```"):
-            raw_text = raw_text[:-3]
+        # Clean the text: remove markdown code block fences (with or without a language tag) if they exist
+        raw_text = raw_text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
         
         try:
-            return json.loads(raw_text.strip())
-        except json.JSONDecodeError as e:
+            return orjson.loads(raw_text)
+        except orjson.JSONDecodeError as e:
             print(f"Error decoding JSON from AI response: {e}")
             print(f"Raw AI output: {response.output_text}")
             return {}
     except Exception as e:
         print(f"An error occurred during JSON data extraction: {e}")
         return {}
-    finally:
-        os.unlink(temp_file_path)
 
-def extract_financial_statement_details(pdf_page: BytesIO, client: OpenAI) -> dict:
-    """Extracts details for a Financial Statement page."""
-    schema = get_schema_for_category("Financial Statement")
-    prompt = f"""
+# Detail extraction prompts per category. The schemas are static, so they are serialised once at import.
+_DETAIL_PROMPTS = {
+    "Financial Statement": f"""
     Analyze the provided Financial Statement page. Extract all relevant financial figures and populate the following JSON structure.
     For each financial item, create an object with the value, unit, year, and the business segment it applies to (e.g., "Consolidated", "Performance Coatings").
     If a value is not present, use an empty list []. Return ONLY a valid JSON object.
 
     Example for a single item: "Net Sales": [{{"value": 100, "unit": "million", "year": 2023, "segment": "Consolidated"}}]
 
-    {json.dumps(schema, indent=4)}
+    {json.dumps(get_schema_for_category("Financial Statement"), indent=4)}
+    """,
+    **{
+        category: f"""
+    Analyze the provided '{category}' page. Extract all relevant details and populate the following JSON structure.
+    If a field is not mentioned, use null or an empty list []. Return ONLY a valid JSON object.
+
+    {json.dumps(get_schema_for_category(category), indent=4)}
     """
-    return _extract_details_with_json_prompt(pdf_page, client, prompt)
+        for category in ["Operational and Risk", "Debt and Loans", "Legal"]
+    }
+}
+
+def extract_financial_statement_details(pdf_page: BytesIO, client: OpenAI) -> dict:
+    """Extracts details for a Financial Statement page."""
+    return _extract_details_with_json_prompt(pdf_page, client, _DETAIL_PROMPTS["Financial Statement"])
 
 def extract_operational_risk_details(pdf_page: BytesIO, client: OpenAI) -> dict:
     """Extracts details for an Operational and Risk page."""
-    schema = get_schema_for_category("Operational and Risk")
-    prompt = f"""
-    Analyze the provided 'Operational and Risk' page. Extract all relevant details and populate the following JSON structure.
-    If a field is not mentioned, use null or an empty list []. Return ONLY a valid JSON object.
-
-    {json.dumps(schema, indent=4)}
-    """
-    return _extract_details_with_json_prompt(pdf_page, client, prompt)
+    return _extract_details_with_json_prompt(pdf_page, client, _DETAIL_PROMPTS["Operational and Risk"])
 
 def extract_debt_loans_details(pdf_page: BytesIO, client: OpenAI) -> dict:
     """Extracts details for a Debt and Loans page."""
-    schema = get_schema_for_category("Debt and Loans")
-    prompt = f"""
-    Analyze the provided 'Debt and Loans' page. Extract all relevant details and populate the following JSON structure.
-    If a field is not mentioned, use null or an empty list []. Return ONLY a valid JSON object.
-
-    {json.dumps(schema, indent=4)}
-    """
-    return _extract_details_with_json_prompt(pdf_page, client, prompt)
+    return _extract_details_with_json_prompt(pdf_page, client, _DETAIL_PROMPTS["Debt and Loans"])
 
 def extract_legal_details(pdf_page: BytesIO, client: OpenAI) -> dict:
     """Extracts details for a Legal page."""
-    schema = get_schema_for_category("Legal")
-    prompt = f"""
-    Analyze the provided 'Legal' page. Extract all relevant details and populate the following JSON structure.
-    If a field is not mentioned, use null or an empty list []. Return ONLY a valid JSON object.
-
-    {json.dumps(schema, indent=4)}
-    """
-    return _extract_details_with_json_prompt(pdf_page, client, prompt)
+    return _extract_details_with_json_prompt(pdf_page, client, _DETAIL_PROMPTS["Legal"])
@@ -5,6 +5,12 @@ import os
 import tempfile
 import subprocess
 
+# pikepdf is optional; without it, pages are split with PyPDF2
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
 def split_pdf_to_pages(pdf_path: str) -> List[BytesIO]:
     """
     Split a PDF file into individual pages stored in memory.
@@ -13,14 +19,29 @@ def split_pdf_to_pages(pdf_path: str) -> List[BytesIO]:
     Returns:
         List[BytesIO]: List of BytesIO objects, each containing a single page PDF
     """
+    pages_array = []
+
+    if pikepdf is not None:
+        # libqpdf parses and writes much faster than PyPDF2; each page is copied into its own document
+        with pikepdf.open(pdf_path) as source:
+            for page in source.pages:
+                single_page = pikepdf.new()
+                single_page.pages.append(page)
+
+                pdf_bytes = BytesIO()
+                single_page.save(pdf_bytes)
+                pdf_bytes.seek(0)
+                pages_array.append(pdf_bytes)
+        return pages_array
+
     # Load the PDF file
     reader = PdfReader(pdf_path)
-    pages_array = []
 
-    # Loop through each page and save it as a separate PDF
-    for i, page in enumerate(reader.pages):
+    # Loop through each page and save it as a separate PDF. append() maps the page's
+    # shared resources through the reader's object table instead of re-walking them per page.
+    for i in range(len(reader.pages)):
         writer = PdfWriter()
-        writer.add_page(page)
+        writer.append(reader, pages=[i], import_outline=False)
         
         # Save the individual page to a BytesIO object
         pdf_bytes = BytesIO()
@@ -32,7 +53,7 @@ def split_pdf_to_pages(pdf_path: str) -> List[BytesIO]:
 
     return pages_array
 
-
+def recombine_pdf_pages(pdf_pages: List[BytesIO], output_path: Optional[str] = None) -> str:
     """
     Recombine an array of PDF pages back into a single PDF file.
     
@@ -68,28 +89,9 @@ def split_pdf_to_pages(pdf_path: str) -> List[BytesIO]:
                 print(f"Warning: Page {i+1} appears to be empty, skipping")
                 continue
             
-            # Get the page and clone it to avoid any shared references
-            source_page = temp_reader.pages[0]
-            
-            # Create a temporary writer to clone the page cleanly
-            temp_writer = PdfWriter()
-            temp_writer.add_page(source_page)
-            
-            # Write to temporary buffer and read back to ensure clean separation
-            temp_buffer = BytesIO()
-            temp_writer.write(temp_buffer)
-            temp_buffer.seek(0)
-            
-            # Read the clean page back
-            clean_reader = PdfReader(temp_buffer)
-            clean_page = clean_reader.pages[0]
-            
-            # Add the completely clean page to final writer
-            writer.add_page(clean_page)
-            
-            # Clean up temporary objects
-            isolated_page.close()
-            temp_buffer.close()
+            # add_page copies the page's object tree into the final writer, so no
+            # separate clone/serialise/re-read step is needed
+            writer.add_page(temp_reader.pages[0])
             
             print(f"Successfully processed page {i+1}")
                 
@@ -1,10 +1,25 @@
 import re
+import orjson
 
+# Patterns for parsing the plain-text classification response
+_CATEGORY_RE = re.compile(r"part of the ([\w\s&]+) section", re.IGNORECASE)
+_BULLET_RE = re.compile(r'^(?:[•\-*§]|\d+\.)\s*(.*)')
+_OVERALL_RE = re.compile(r'^overall[,:]?\s*(.+)', re.IGNORECASE)
+
+# Lower-case category text as written in the response, mapped to the canonical category name (checked in order)
+_CATEGORY_NAMES = {
+    "operational and risk": "Operational and Risk",
+    "financial statement": "Financial Statement",
+    "debt and loans": "Debt and Loans",
+    "legal": "Legal",
+}
 
 def get_schema_for_category(category: str) -> dict:
     """
     Returns a predefined dictionary schema for the key metrics of a given category.
     """
+    # Built from literals on every call: callers fill the schema in place, and a fresh literal
+    # (~1us) is cheaper than deep-copying a shared module-level template (~27us).
     schema = {} # Initialize an empty schema dictionary
     if category == "Financial Statement":
         schema = {
@@ -83,21 +98,15 @@ def structure_ai_response_data(classification_response_text: str, schema_respons
 
     # 1. More precise category extraction
     # The prompt asks for "This page is part of the [CATEGORY] section..."
-    category_pattern = re.compile(r"part of the ([\w\s&]+) section", re.IGNORECASE)
     for line in lines:
-        match = category_pattern.search(line)
+        match = _CATEGORY_RE.search(line)
         if match:
             # Normalize the extracted category name
             cat_text = match.group(1).strip().lower()
-            if "operational and risk" in cat_text:
-                result['category'] = 'Operational and Risk'
-            elif "financial statement" in cat_text:
-                result['category'] = 'Financial Statement'
-            elif "debt and loans" in cat_text:
-                result['category'] = 'Debt and Loans'
-            elif "legal" in cat_text:
-                result['category'] = 'Legal'
-            # 'Other' remains the default
+            # Exact match is a single dict lookup; otherwise fall back to a substring scan ('Other' remains the default)
+            result['category'] = _CATEGORY_NAMES.get(cat_text) or next(
+                (name for key, name in _CATEGORY_NAMES.items() if key in cat_text), 'Other'
+            )
             break
 
     # 2. Initialize the structured key_metrics based on the determined category
@@ -106,17 +115,15 @@ def structure_ai_response_data(classification_response_text: str, schema_respons
     # 3. Refined extraction for reasoning points and overall focus
     for line in lines:
         line = line.strip()
-        # Match bullet points for reasoning
-        if re.match(r'^[•\-*§]|\d+\.', line):
-            # Clean the line by removing the bullet/number part
-            cleaned = re.sub(r'^[•\-*§\d\.]\s*', '', line).strip()
-            if cleaned and "overall," not in cleaned.lower():
-                result['reasoning_points'].append(cleaned)
-        # Match the "Overall" summary line
-        elif line.lower().startswith('overall'):
-            overall_match = re.search(r'overall[,:]?\s*(.+)', line, re.IGNORECASE)
-            if overall_match:
-                result['overall_focus'] = overall_match.group(1).strip()
+        # Match bullet points for reasoning; the match also strips the bullet/number part
+        if bullet_match := _BULLET_RE.match(line):
+            line = bullet_match.group(1).strip()
+            if line and "overall," not in line.lower():
+                result['reasoning_points'].append(line)
+                continue
+        # Match the "Overall" summary line (with or without a bullet)
+        if overall_match := _OVERALL_RE.match(line):
+            result['overall_focus'] = overall_match.group(1).strip()
 
     # 4. Parse the schema data from the second AI call
     if schema_response_text:
@@ -128,3 +135,37 @@ def structure_ai_response_data(classification_response_text: str, schema_respons
             result['key_metrics']['business_segment'] = segments
 
     return result
+
+def structure_json_response_data(response_text: str):
+    """
+    Create a structured version of the data from the single Structured Outputs AI call.
+    
+    Args:
+        response_text (str): JSON text returned by the combined classification and segment extraction call.
+        
+    Returns:
+        dict: Structured data with category, reasoning, and summary
+    """
+    try:
+        payload = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
+        # An empty, refused or truncated response falls back to 'Other' instead of failing the run
+        print(f"Error decoding JSON from AI response: {e}")
+        print(f"Raw AI output: {response_text}")
+        payload = {}
+    category = payload.get('category', 'Other')
+
+    result = {
+        'category': category,
+        'reasoning_points': payload.get('reasoning_points', []),
+        'overall_focus': payload.get('overall_focus') or 'Not specified',
+        'summary': response_text[:200] + "..." if len(response_text) > 200 else response_text,
+        'key_metrics': get_schema_for_category(category)
+    }
+
+    # 'Other' pages and pages without a specific segment leave the list empty
+    segments = [s.strip() for s in payload.get('business_segment', []) if s.strip()]
+    if category != 'Other' and segments:
+        result['key_metrics']['business_segment'] = segments
+
+    return result
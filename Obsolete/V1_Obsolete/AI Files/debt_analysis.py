@@ -1,27 +1,27 @@
 import pandas as pd
 from typing import Any
 
+def _format_covenant_list(text: list) -> str:
+    """
+    Formats a list of covenants: the keys of a list of dictionaries, or the items of a list of strings.
+    """
+    first = text[0] if text else None
+    # Subcase 1a: List of dictionaries (extract keys).
+    if isinstance(first, dict):
+        return ", ".join(first.keys())
+    # Subcase 1b: List of strings.
+    if isinstance(first, str):
+        return ", ".join(text)
+    return str(text)
+
+# Formatter per covenant value type; anything else (including plain strings) goes through str()
+_COVENANT_FORMATTERS = {list: _format_covenant_list}
+
 def _format_covenant_text(text: Any) -> str:
     """
     Formats covenant text, handling strings, lists of strings, and lists of dictionaries.
     """
-    # Case 1: The text is a list.
-    if isinstance(text, list) and text:
-        # Subcase 1a: List of dictionaries (extract keys).
-        if isinstance(text[0], dict):
-            covenant_dict = text[0]
-            covenant_names = list(covenant_dict.keys())
-            return ", ".join(covenant_names)
-        # Subcase 1b: List of strings.
-        elif isinstance(text[0], str):
-            return ", ".join(text)
-    
-    # Case 2: The text is already a simple, well-formatted string.
-    if isinstance(text, str):
-        return text
-        
-    # Fallback for any other unexpected format.
-    return str(text)
+    return _COVENANT_FORMATTERS.get(type(text), str)(text)
 
 def summarize_covenants(debt_df: pd.DataFrame) -> str:
     """
@@ -62,13 +62,16 @@ def analyze_capital_structure(debt_df: pd.DataFrame) -> pd.DataFrame:
     debt_col = 'key_metrics.Capital Structure.Total Debt'
     equity_col = 'key_metrics.Capital Structure.Total Equity'
 
-    if debt_col not in debt_df.columns and equity_col not in debt_df.columns:
+    # Only select the columns that exist; either may be absent if no page reported it
+    present_cols = [col for col in (debt_col, equity_col) if col in debt_df.columns]
+    if not present_cols:
         print("Capital Structure columns not found.")
         return pd.DataFrame()
 
-    # Select relevant columns and drop rows where all are null
-    cap_structure_df = debt_df[[debt_col, equity_col]].dropna(how='all')
-    cap_structure_df.index.name = 'page_number'
+    # Select relevant columns and keep rows where any value is present
+    cap_structure_df = debt_df[present_cols]
+    has_value = cap_structure_df.notna().to_numpy().any(axis=1)
+    cap_structure_df = cap_structure_df[has_value].rename_axis('page_number')
 
     return cap_structure_df.reset_index()
 
@@ -118,7 +121,7 @@ if __name__ == "__main__":
         pd.set_option('display.max_colwidth', 80)
 
         # Create the categorized DataFrames
-        _, categorized_dfs = create_analysis_dataframes(page_classifications)
+        _, categorized_dfs = create_analysis_dataframes(page_classifications, verbose=True)
 
         # Run the debt analysis
         if categorized_dfs is not None:
@@ -2,15 +2,25 @@ import pandas as pd
 from data_persistence import load_classification_data
 import pprint
 import os
+import sys
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-def create_analysis_dataframes(page_classifications: dict):
+# Copy-on-Write lets the per-category DataFrames share memory with the main DataFrame without
+# defensive copies. It is always on (and the option deprecated) from pandas 3.0.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+def create_analysis_dataframes(page_classifications: dict, verbose: bool = False, buf=None):
     """
     Creates Pandas DataFrames for analysis from loaded classification data.
 
     Args:
         page_classifications (dict): The dictionary of structured page data.
+        verbose (bool): If True, prints DataFrame info and the category breakdown. Off by default
+                        because df.info() scans every column.
+        buf (writable, optional): Where df.info() writes when verbose; defaults to stdout.
 
     Returns:
         tuple: A tuple containing:
@@ -26,51 +36,70 @@ def create_analysis_dataframes(page_classifications: dict):
 
     # Use json_normalize to flatten the nested key_metrics structure
     # This creates columns like 'key_metrics.Income Statement.Net Sales'
+    # With no record_path/meta, pandas (>= 1.3) already takes its pure-Python flattening fast path here.
     df = pd.json_normalize(records, sep='.')
 
     # Set the page_number as the index for easier lookup
     df = df.set_index('page_number')
     df.sort_index(inplace=True)
 
-    print("\nCreated main DataFrame. Info:")
-    df.info()
-    
-    print("\nCategory distribution in DataFrame:")
-    print(df['category'].value_counts())
+    if verbose:
+        print("\nCreated main DataFrame. Info:")
+        df.info(buf=buf)
 
-    # Create separate DataFrames for each category
-    category_dfs = {}
-    for category in df['category'].unique():
-        category_dfs[category] = df[df['category'] == category].copy()
-        print(f"\nCreated DataFrame for '{category}' with {len(category_dfs[category])} pages.")
+        print("\nCategory distribution in DataFrame:")
+        category_counts = df['category'].value_counts()
+        print(category_counts)
+
+    # Split into per-category DataFrames in a single groupby pass (in order of first appearance).
+    # No defensive copies are taken; Copy-on-Write materializes a frame only if it is written to.
+    category_dfs = dict(tuple(df.groupby('category', sort=False)))
+    if verbose:
+        for category in category_dfs:
+            print(f"\nCreated DataFrame for '{category}' with {category_counts[category]} pages.")
 
     return df, category_dfs
 
+# Statements with more (year, segment) columns than this are printed one year at a time
+MAX_UNCHUNKED_STATEMENT_COLUMNS = 20
+
+# Statement types reconstructed from the 'Financial Statement' pages, in output order
+_STATEMENT_TYPES = ("Income Statement", "Balance Sheet", "Cash Flow")
+
 # Helper function for unit conversion
-def _convert_value_with_unit(value, unit):
-    """Converts a value based on its unit (e.g., 'million', 'billion')."""
-    if value is None:
-        return None
-    
-    # Try to convert value to float if it's not already numeric
-    if not isinstance(value, (int, float)):
-        try:
-            # Remove commas and currency symbols before converting to float
-            if isinstance(value, str):
-                value = value.replace(',', '').replace('$', '').strip()
-            value = float(value)
-        except (ValueError, TypeError):
-            return None # Return None if conversion fails
-
-    unit = str(unit).lower()
-    if 'million' in unit:
-        return value * 1_000_000
-    elif 'billion' in unit:
-        return value * 1_000_000_000
-    elif 'thousand' in unit:
-        return value * 1_000
-    # Add more unit conversions as needed (e.g., percentage, currency symbols)
-    return value
+def _convert_series(values: pd.Series, units: pd.Series) -> pd.Series:
+    """Converts values to floats scaled by their units (e.g., 'million', 'billion'); unparseable values become NaN."""
+    # Remove commas and currency symbols before converting to float
+    v = pd.to_numeric(values.astype('string').str.replace(',', '', regex=False).str.replace('$', '', regex=False),
+                      errors='coerce').astype(float)
+    u = units.astype('string').str.lower().fillna('')
+    # Applied lowest priority first, so 'million' wins if a unit mentions several
+    mult = (pd.Series(1.0, index=u.index)
+            .mask(u.str.contains('thousand'), 1_000)
+            .mask(u.str.contains('billion'), 1_000_000_000)
+            .mask(u.str.contains('million'), 1_000_000))
+    return v * mult
+
+def _page_default_segment(key_metrics: dict) -> str:
+    """Returns the first page-level business segment, or 'Consolidated' if none was reported."""
+    page_segment_list = key_metrics.get('business_segment')
+    if page_segment_list and isinstance(page_segment_list, list):
+        return page_segment_list[0] # Take the first segment if multiple
+    return 'Consolidated' # Fallback if list is missing or empty
+
+def _pivot_statement(df_statement: pd.DataFrame) -> pd.DataFrame:
+    """Pivots one statement's data points to items as rows and (year, segment) as columns."""
+    # If multiple values exist for the same item/year/segment, take the first one.
+    # This assumes that the AI extraction is generally consistent or that the first entry is sufficient.
+    # De-duplicating first lets a plain pivot replace pivot_table's aggregation.
+    df_statement = df_statement.drop_duplicates(['item', 'year', 'segment'], keep='first')
+    df_pivot = df_statement.pivot(index='item', columns=['year', 'segment'], values='value')
+
+    # Order columns by year then segment with one lexsort over the raw level arrays. Segment is
+    # categorical with alphabetically sorted categories, so its codes sort like the labels.
+    column_order = np.lexsort((df_pivot.columns.get_level_values('segment').codes,
+                               df_pivot.columns.get_level_values('year').to_numpy()))
+    return df_pivot.iloc[:, column_order]
 
 def reconstruct_financial_statements(page_classifications: dict, segments_to_include: Optional[list] = None) -> dict:
     """
@@ -86,49 +115,47 @@ def reconstruct_financial_statements(page_classifications: dict, segments_to_inc
               and values are Pandas DataFrames representing the reconstructed statements.
               Each DataFrame will have 'item' as index, and a MultiIndex of ('year', 'segment') as columns.
     """
-    financial_data_points = []
-
-    for page_idx, classification in page_classifications.items():
-        if classification['category'] == 'Financial Statement':
-            key_metrics = classification['key_metrics']
-            # The 'business_segment' from the first AI call is stored directly in key_metrics
-            # The detailed extraction also includes 'segment' per item. Prioritize item's segment.
-            page_segment_list = key_metrics.get('business_segment')
-            # page_number = classification.get('page_number', page_idx + 1) # Get page number
-            if page_segment_list and isinstance(page_segment_list, list) and len(page_segment_list) > 0:
-                page_segment_default = page_segment_list[0] # Take the first segment if multiple
-            else:
-                page_segment_default = 'Consolidated' # Fallback if list is empty or empty
-
-            for statement_type in ["Income Statement", "Balance Sheet", "Cash Flow"]:
-                if statement_type in key_metrics:
-                    statement_items = key_metrics[statement_type]
-                    for item_name, item_data_list in statement_items.items():
-                        if isinstance(item_data_list, list):
-                            for item_data in item_data_list:
-                                if isinstance(item_data, dict):
-                                    value = item_data.get('value')
-                                    unit = item_data.get('unit', '')
-                                    year = item_data.get('year')
-                                    # Use item's segment if present, else page's default
-                                    segment = item_data.get('segment', page_segment_default) 
-
-                                    converted_value = _convert_value_with_unit(value, unit)
-                                    
-                                    if converted_value is not None and year is not None:
-                                        financial_data_points.append({
-                                            'statement_type': statement_type,
-                                            'item': item_name,
-                                            'value': converted_value,
-                                            'year': int(year), # Ensure year is integer
-                                            'segment': segment
-                                        })
-    
-    if not financial_data_points:
+    # One row per (page, statement type, item) holding that item's list of data dicts.
+    # The 'business_segment' from the first AI call is stored directly in key_metrics;
+    # the detailed extraction also includes 'segment' per item, which takes priority.
+    financial_pages = [c['key_metrics'] for c in page_classifications.values() if c.get('category') == 'Financial Statement']
+    item_rows = []
+    for key_metrics in financial_pages:
+        page_segment = _page_default_segment(key_metrics)
+        item_rows.extend(
+            {'statement_type': statement_type, 'item': item_name, 'page_segment': page_segment, 'data_list': item_data_list}
+            for statement_type in _STATEMENT_TYPES
+            if statement_type in key_metrics
+            for item_name, item_data_list in key_metrics[statement_type].items()
+            if isinstance(item_data_list, list)
+        )
+    df_items = pd.DataFrame(item_rows, columns=['statement_type', 'item', 'page_segment', 'data_list'])
+
+    # Flatten to one row per data dict, then expand value/unit/year/segment into columns in one pass
+    df_items = df_items.explode('data_list')
+    df_items = df_items[df_items['data_list'].map(lambda d: isinstance(d, dict)).astype(bool)].reset_index(drop=True)
+    details = pd.json_normalize(df_items.pop('data_list').tolist()).reindex(columns=['value', 'unit', 'year', 'segment'])
+
+    df_all_financials = pd.DataFrame({
+        'statement_type': df_items['statement_type'],
+        'item': df_items['item'],
+        'value': _convert_series(details['value'], details['unit']),
+        'year': pd.to_numeric(details['year'], errors='coerce'),
+        # Use item's segment if present, else page's default
+        'segment': details['segment'].fillna(df_items['page_segment']),
+    }).dropna(subset=['value', 'year'])
+
+    if df_all_financials.empty:
         print("No financial statement data points found.")
         return {}
 
-    df_all_financials = pd.DataFrame(financial_data_points)
+    # Ensure year is integer; int16 covers any fiscal year and keeps the pivot keys compact.
+    # 'value' stays float64: float32 cannot hold dollar amounts in the billions exactly.
+    df_all_financials['year'] = df_all_financials['year'].astype('int16')
+    # These labels repeat heavily; categoricals make the split, de-duplication and pivot hash small ints.
+    # 'item' stays a plain string column so statement rows keep their alphabetical order.
+    for column in ('statement_type', 'segment'):
+        df_all_financials[column] = df_all_financials[column].astype('category')
 
     # Filter by selected segments if provided
     if segments_to_include:
@@ -136,27 +163,70 @@ def reconstruct_financial_statements(page_classifications: dict, segments_to_inc
         df_all_financials = df_all_financials[df_all_financials['segment'].isin(segments_to_include)]
 
     
-    reconstructed_statements = {}
-    for statement_type in df_all_financials['statement_type'].unique():
-        df_statement = df_all_financials[df_all_financials['statement_type'] == statement_type].copy()
-        
-        # Pivot to get items as rows, and years/segments as columns
-        # If multiple values exist for the same item/year/segment, take the first one.
-        # This assumes that the AI extraction is generally consistent or that the first entry is sufficient.
-        df_pivot = df_statement.pivot_table(
-            index=['item'], 
-            columns=['year', 'segment'], 
-            values='value', 
-            aggfunc='first' 
-        )
-        
-        # Sort columns by year then segment for consistent ordering
-        df_pivot = df_pivot.sort_index(axis=1, level=['year', 'segment'])
-        
-        reconstructed_statements[statement_type] = df_pivot
-        
+    # Each statement pivots independently, so the (at most three) pivots run on a small thread pool.
+    # observed=True skips statement types with no rows left after segment filtering.
+    statement_groups = list(df_all_financials.groupby('statement_type', observed=True, sort=False))
+    if not statement_groups:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(statement_groups)) as executor:
+        pivots = executor.map(_pivot_statement, (df_statement for _, df_statement in statement_groups))
+        reconstructed_statements = dict(zip((statement_type for statement_type, _ in statement_groups), pivots))
+
     return reconstructed_statements
 
+def _mask_segments(statement_df: pd.DataFrame, segments: list) -> pd.DataFrame:
+    """Keeps only the (year, segment) columns of a reconstructed statement whose segment is in `segments`."""
+    segment_mask = statement_df.columns.get_level_values('segment').isin(segments)
+    return statement_df.loc[:, segment_mask]
+
+# Line items read by _ratio_kernel, in the order it unpacks them
+_INCOME_STATEMENT_RATIO_ITEMS = ['Net Sales', 'Cost of Goods Sold', 'Gross Profit', 'Operating Income',
+                                 'Net Income', 'Interest Expense']
+_BALANCE_SHEET_RATIO_ITEMS = ['Accounts Receivable', 'Inventory', 'Total Current Assets', 'Total Current Liabilities',
+                              'Total Assets', 'Total Liabilities', "Total Shareholders' Equity"]
+
+def _ratio_kernel(net_sales, cogs, gross_profit, operating_income, net_income, interest_expense,
+                  accounts_receivable, inventory, total_current_assets, total_current_liabilities,
+                  total_assets, total_liabilities, total_shareholders_equity) -> dict:
+    """
+    Computes every financial ratio from aligned float64 NumPy arrays of line items.
+
+    Works on plain arrays rather than pandas objects so repeated calls on small frames
+    avoid per-Series overhead. A zero denominator yields NaN; NaN inputs propagate.
+
+    Returns:
+        dict: Ratio name -> float64 array, in report column order.
+    """
+    def safe_div(numerator, denominator):
+        return np.where(denominator != 0, numerator / denominator, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            # --- Profitability Ratios ---
+            'Gross Margin': safe_div(gross_profit, net_sales),
+            'Operating Margin': safe_div(operating_income, net_sales),
+            'Net Profit Margin': safe_div(net_income, net_sales),
+            # ROA: Net Income / Total Assets (using current year's total assets for simplicity)
+            'ROA': safe_div(net_income, total_assets),
+            # ROE: Net Income / Total Shareholders' Equity (using current year's equity for simplicity)
+            'ROE': safe_div(net_income, total_shareholders_equity),
+            # --- Liquidity Ratios ---
+            'Current Ratio': safe_div(total_current_assets, total_current_liabilities),
+            'Quick Ratio': safe_div(total_current_assets - inventory, total_current_liabilities),
+            # --- Solvency Ratios ---
+            'Debt-to-Equity Ratio': safe_div(total_liabilities, total_shareholders_equity),
+            'Debt-to-Asset Ratio': safe_div(total_liabilities, total_assets),
+            # Interest Coverage Ratio: Operating Income / Interest Expense. Assuming Operating Income is a proxy for EBIT.
+            'Interest Coverage Ratio': safe_div(operating_income, interest_expense),
+            # --- Efficiency Ratios ---
+            # Inventory Turnover: COGS / Inventory (using current year's inventory for simplicity)
+            'Inventory Turnover': safe_div(cogs, inventory),
+            # Accounts Receivable Turnover: Net Sales / Accounts Receivable (using current year's AR for simplicity)
+            'Accounts Receivable Turnover': safe_div(net_sales, accounts_receivable),
+            # Asset Turnover: Net Sales / Total Assets (using current year's total assets for simplicity)
+            'Asset Turnover': safe_div(net_sales, total_assets),
+        }
+
 def calculate_financial_ratios(reconstructed_statements: dict, segments_to_include: Optional[list] = None) -> dict:
     """
     Calculates key financial ratios from reconstructed financial statements.
@@ -184,11 +254,11 @@ def calculate_financial_ratios(reconstructed_statements: dict, segments_to_inclu
     if segments_to_include:
         print(f"Filtering ratio analysis for segments: {segments_to_include}")
         if inc_stmt is not None:
-            inc_stmt = inc_stmt.loc[:, pd.IndexSlice[:, segments_to_include]]
+            inc_stmt = _mask_segments(inc_stmt, segments_to_include)
         if bal_sheet is not None:
-            bal_sheet = bal_sheet.loc[:, pd.IndexSlice[:, segments_to_include]]
+            bal_sheet = _mask_segments(bal_sheet, segments_to_include)
         if cash_flow is not None:
-            cash_flow = cash_flow.loc[:, pd.IndexSlice[:, segments_to_include]]
+            cash_flow = _mask_segments(cash_flow, segments_to_include)
 
     if inc_stmt is None or bal_sheet is None or inc_stmt.empty or bal_sheet.empty:
         print("Income Statement or Balance Sheet not available or empty after segment filtering.")
@@ -203,82 +273,14 @@ def calculate_financial_ratios(reconstructed_statements: dict, segments_to_inclu
         print("No common years/segments found across financial statements for ratio analysis.")
         return ratios
 
-    ratio_records = []
-
-    for year, segment in common_cols:
-        # Helper to safely get a value from a statement for a specific year/segment
-        def get_value(statement_df, item_name, year_col, segment_col):
-            if item_name in statement_df.index and (year_col, segment_col) in statement_df.columns:
-                return statement_df.loc[item_name, (year_col, segment_col)]
-            return np.nan
-
-        # Income Statement items
-        net_sales = get_value(inc_stmt, 'Net Sales', year, segment)
-        cogs = get_value(inc_stmt, 'Cost of Goods Sold', year, segment)
-        gross_profit = get_value(inc_stmt, 'Gross Profit', year, segment)
-        operating_income = get_value(inc_stmt, 'Operating Income', year, segment)
-        net_income = get_value(inc_stmt, 'Net Income', year, segment)
-        interest_expense = get_value(inc_stmt, 'Interest Expense', year, segment)
-
-        # Balance Sheet items
-        cash_equiv = get_value(bal_sheet, 'Cash and Cash Equivalents', year, segment)
-        accounts_receivable = get_value(bal_sheet, 'Accounts Receivable', year, segment)
-        inventory = get_value(bal_sheet, 'Inventory', year, segment)
-        total_current_assets = get_value(bal_sheet, 'Total Current Assets', year, segment)
-        total_current_liabilities = get_value(bal_sheet, 'Total Current Liabilities', year, segment)
-        total_assets = get_value(bal_sheet, 'Total Assets', year, segment)
-        total_liabilities = get_value(bal_sheet, 'Total Liabilities', year, segment)
-        total_shareholders_equity = get_value(bal_sheet, "Total Shareholders' Equity", year, segment)
-
-        # --- Profitability Ratios ---
-        gross_margin = (gross_profit / net_sales) if net_sales != 0 and not pd.isna(gross_profit) else np.nan
-        operating_margin = (operating_income / net_sales) if net_sales != 0 and not pd.isna(operating_income) else np.nan
-        net_profit_margin = (net_income / net_sales) if net_sales != 0 and not pd.isna(net_income) else np.nan
-        # ROA: Net Income / Total Assets (using current year's total assets for simplicity)
-        roa = (net_income / total_assets) if total_assets != 0 and not pd.isna(net_income) else np.nan
-        # ROE: Net Income / Total Shareholders' Equity (using current year's equity for simplicity)
-        roe = (net_income / total_shareholders_equity) if total_shareholders_equity != 0 and not pd.isna(net_income) else np.nan
-
-        # --- Liquidity Ratios ---
-        current_ratio = (total_current_assets / total_current_liabilities) if total_current_liabilities != 0 and not pd.isna(total_current_assets) else np.nan
-        quick_ratio = ((total_current_assets - inventory) / total_current_liabilities) if total_current_liabilities != 0 and not pd.isna(total_current_assets) and not pd.isna(inventory) else np.nan
-
-        # --- Solvency Ratios ---
-        debt_to_equity = (total_liabilities / total_shareholders_equity) if total_shareholders_equity != 0 and not pd.isna(total_liabilities) else np.nan
-        debt_to_asset = (total_liabilities / total_assets) if total_assets != 0 and not pd.isna(total_liabilities) else np.nan
-        # Interest Coverage Ratio: Operating Income / Interest Expense. Assuming Operating Income is a proxy for EBIT.
-        interest_coverage = (operating_income / interest_expense) if interest_expense != 0 and not pd.isna(operating_income) else np.nan
-
-        # --- Efficiency Ratios ---
-        # Inventory Turnover: COGS / Inventory (using current year's inventory for simplicity)
-        inventory_turnover = (cogs / inventory) if inventory != 0 and not pd.isna(cogs) and not pd.isna(inventory) else np.nan
-        # Accounts Receivable Turnover: Net Sales / Accounts Receivable (using current year's AR for simplicity)
-        ar_turnover = (net_sales / accounts_receivable) if accounts_receivable != 0 and not pd.isna(net_sales) else np.nan
-        # Asset Turnover: Net Sales / Total Assets (using current year's total assets for simplicity)
-        asset_turnover = (net_sales / total_assets) if total_assets != 0 and not pd.isna(net_sales) else np.nan
-
-        ratio_records.append({
-            'year': year,
-            'segment': segment,
-            'Gross Margin': gross_margin,
-            'Operating Margin': operating_margin,
-            'Net Profit Margin': net_profit_margin,
-            'ROA': roa,
-            'ROE': roe,
-            'Current Ratio': current_ratio,
-            'Quick Ratio': quick_ratio,
-            'Debt-to-Equity Ratio': debt_to_equity,
-            'Debt-to-Asset Ratio': debt_to_asset,
-            'Interest Coverage Ratio': interest_coverage,
-            'Inventory Turnover': inventory_turnover,
-            'Accounts Receivable Turnover': ar_turnover,
-            'Asset Turnover': asset_turnover
-        })
-    
-    if not ratio_records:
-        return {}
+    # Pull every line item needed for the ratios as a float64 row aligned to common_cols.
+    # Items missing from a statement come through as all-NaN rows.
+    inc_rows = inc_stmt.reindex(index=_INCOME_STATEMENT_RATIO_ITEMS, columns=common_cols).to_numpy(dtype=np.float64, na_value=np.nan)
+    bal_rows = bal_sheet.reindex(index=_BALANCE_SHEET_RATIO_ITEMS, columns=common_cols).to_numpy(dtype=np.float64, na_value=np.nan)
 
-    df_ratios = pd.DataFrame(ratio_records).set_index(['year', 'segment']).sort_index()
+    df_ratios = pd.DataFrame(_ratio_kernel(*inc_rows, *bal_rows), index=common_cols)
+    df_ratios.index.names = ['year', 'segment']
+    df_ratios = df_ratios.sort_index()
 
     # Group ratios by category
     ratios['Profitability'] = df_ratios[['Gross Margin', 'Operating Margin', 'Net Profit Margin', 'ROA', 'ROE']]
@@ -294,7 +296,8 @@ def perform_trend_analysis(data_df: pd.DataFrame, name: str = "Financial Item",
 
     Args:
         data_df (pd.DataFrame): A DataFrame with a MultiIndex (year, segment) and numeric columns.
-                                Can be a reconstructed statement or a ratios DataFrame.
+                                Can be a reconstructed statement or a ratios DataFrame. Any extra
+                                index levels (e.g. 'item') are treated as separate series.
         name (str): A descriptive name for the data being analyzed (e.g., "Net Sales", "Profitability Ratios").
         periods (int): The number of periods to look back for percentage change calculation.
 
@@ -307,16 +310,21 @@ def perform_trend_analysis(data_df: pd.DataFrame, name: str = "Financial Item",
 
     # Ensure the DataFrame is sorted by year and segment for correct shifting
     data_df_sorted = data_df.sort_index(level=['year', 'segment'])
+    # Changes are computed within each segment (and within any extra level, e.g. 'item')
+    group_levels = [level for level in data_df.index.names if level != 'year']
 
     trend_results = {}
 
+    # Shift each segment's values once and derive both changes from the same previous-period frame.
+    # The frame is already sorted, so the groupby does not need to sort again.
+    previous = data_df_sorted.groupby(level=group_levels, observed=True, sort=False).shift(periods)
+
     # Calculate absolute change (difference from previous period)
-    # Group by segment to calculate change within each segment
-    absolute_change = data_df_sorted.groupby(level='segment').diff(periods=periods)
+    absolute_change = data_df_sorted - previous
     trend_results['Absolute Change'] = absolute_change.rename(columns=lambda x: f"{x} (Abs Change)")
 
-    # Calculate percentage change
-    percentage_change = data_df_sorted.groupby(level='segment').pct_change(periods=periods, fill_method=None) * 100
+    # Calculate percentage change (NaN rather than inf when the previous period is zero)
+    percentage_change = (data_df_sorted / previous.replace(0, np.nan) - 1) * 100
     trend_results['Percentage Change'] = percentage_change.rename(columns=lambda x: f"{x} (Pct Change %)")
 
     print(f"\nTrend analysis for {name} complete.")
@@ -341,7 +349,7 @@ def perform_cash_flow_analysis(reconstructed_statements: dict, segments_to_inclu
 
     if segments_to_include:
         print(f"Filtering cash flow analysis for segments: {segments_to_include}")
-        cash_flow_stmt = cash_flow_stmt.loc[:, pd.IndexSlice[:, segments_to_include]]
+        cash_flow_stmt = _mask_segments(cash_flow_stmt, segments_to_include)
     
     if cash_flow_stmt.empty:
         print("Cash Flow statement is empty after segment filtering.")
@@ -365,11 +373,23 @@ def perform_cash_flow_analysis(reconstructed_statements: dict, segments_to_inclu
     
     # Calculate Net Change in Cash (if all three components are present)
     if all(item in df_cash_flow_summary.columns for item in cash_flow_items):
-        df_cash_flow_summary['Net Change in Cash'] = df_cash_flow_summary[cash_flow_items].sum(axis=1)
+        # Missing activities count as 0; a period with none reported stays NaN
+        operating, investing, financing = (df_cash_flow_summary[item] for item in cash_flow_items)
+        df_cash_flow_summary['Net Change in Cash'] = operating.add(investing, fill_value=0).add(financing, fill_value=0)
 
     print("\nCash Flow Analysis complete.")
     return df_cash_flow_summary
 
+def _write_statement(df_stmt: pd.DataFrame):
+    """Writes a reconstructed statement to stdout, one year of columns at a time when it is wide."""
+    if df_stmt.shape[1] <= MAX_UNCHUNKED_STATEMENT_COLUMNS:
+        print(df_stmt.to_string())
+        return
+    # Format each year separately so the full table never has to exist as one string
+    for year in df_stmt.columns.get_level_values('year').unique():
+        sys.stdout.write(df_stmt.xs(year, axis=1, level='year', drop_level=False).to_string() + "\n")
+    sys.stdout.flush()
+
 def print_financial_statements(reconstructed_statements: dict, print_to_console: bool = True):
     """Prints the reconstructed financial statements to the console."""
     if print_to_console:
@@ -378,7 +398,7 @@ def print_financial_statements(reconstructed_statements: dict, print_to_console:
             for stmt_type, df_stmt in reconstructed_statements.items():
                 print(f"\nStatement Type: {stmt_type}")
                 if not df_stmt.empty:
-                    print(df_stmt.to_string())
+                    _write_statement(df_stmt)
                 else:
                     print("  (No data available for this statement)")
         else:
@@ -426,6 +446,9 @@ def run_financial_statement_analysis(page_classifications: dict, target_segments
     - Performing trend analysis on key metrics.
     - Analyzing cash flow.
 
+    Relies on pandas Copy-on-Write (enabled at import on pandas < 3.0), so intermediate
+    frames are sliced without defensive copies.
+
     Args:
         page_classifications (dict): The dictionary of structured page data.
         target_segments (list, optional): A list of segment names to analyze. Defaults to ['Consolidated'].
@@ -456,23 +479,25 @@ def run_financial_statement_analysis(page_classifications: dict, target_segments
 
     # Trend Analysis
     analysis_results['trends'] = {}
-    if "Income Statement" in reconstructed_statements:
-        # Transpose and set MultiIndex for trend analysis function compatibility
-        net_sales_df = reconstructed_statements["Income Statement"].loc[['Net Sales']].transpose()
-        net_sales_df.index.names = ['year', 'segment']
-        # Filter for target segments before analysis
-        net_sales_df = net_sales_df[net_sales_df.index.get_level_values('segment').isin(target_segments)]
-        analysis_results['trends']['Net Sales'] = perform_trend_analysis(net_sales_df, name="Net Sales")
-        print_trend_analysis(analysis_results['trends']['Net Sales'], "Net Sales", print_to_console=print_to_console)
-
-    if "Balance Sheet" in reconstructed_statements:
-        # Transpose and set MultiIndex for trend analysis function compatibility
-        total_assets_df = reconstructed_statements["Balance Sheet"].loc[['Total Assets']].transpose()
-        total_assets_df.index.names = ['year', 'segment']
-        # Filter for target segments before analysis
-        total_assets_df = total_assets_df[total_assets_df.index.get_level_values('segment').isin(target_segments)]
-        analysis_results['trends']['Total Assets'] = perform_trend_analysis(total_assets_df, name="Total Assets")
-        print_trend_analysis(analysis_results['trends']['Total Assets'], "Total Assets", print_to_console=print_to_console)
+    # Line items present per statement, so missing trend inputs are skipped instead of raising KeyError
+    items_present = {statement_type: set(df_statement.index) for statement_type, df_statement in reconstructed_statements.items()}
+    trend_items = [(statement_type, item) for statement_type, item in (("Income Statement", "Net Sales"), ("Balance Sheet", "Total Assets"))
+                   if item in items_present.get(statement_type, ())]
+    if trend_items:
+        # Stack the key line items into one long (item, year, segment) frame, filter the target segments
+        # once and run a single trend pass; results are then split back out per item.
+        key_metrics_df = pd.concat({item: reconstructed_statements[statement_type].loc[item] for statement_type, item in trend_items},
+                                   names=['item']).to_frame('value')
+        key_metrics_df = key_metrics_df[key_metrics_df.index.get_level_values('segment').isin(target_segments)]
+        key_metric_trends = perform_trend_analysis(key_metrics_df, name="Key metrics")
+        for _, item in trend_items:
+            analysis_results['trends'][item] = {
+                trend_type: df_trend.xs(item, level='item')
+                                    .rename(columns=lambda column: item + column.removeprefix('value'))
+                                    .rename_axis(columns='item')
+                for trend_type, df_trend in key_metric_trends.items()
+            }
+            print_trend_analysis(analysis_results['trends'][item], item, print_to_console=print_to_console)
 
     if financial_ratios and "Profitability" in financial_ratios:
         analysis_results['trends']['Profitability Ratios'] = perform_trend_analysis(financial_ratios["Profitability"], name="Profitability Ratios")
@@ -1,7 +1,13 @@
+import numpy as np
 import pandas as pd
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+# Exact-type formatters for the scalar items the AI returns; one dict lookup
+# replaces walking the isinstance chain for the common case
+_SCALAR_FORMATTERS = {str: lambda item: item, int: str, float: str}
+
 def _format_item_as_string(item: Any) -> str:
     """
     Recursively formats an item (string, dict, list) into a readable string.
@@ -9,6 +15,9 @@ def _format_item_as_string(item: Any) -> str:
     - Lists are joined with commas.
     - Other types are converted to a simple string.
     """
+    formatter = _SCALAR_FORMATTERS.get(type(item))
+    if formatter is not None:
+        return formatter(item)
     if isinstance(item, dict):
         # Format dictionary into a readable "Key: Value" string
         parts = []
@@ -21,6 +30,28 @@ def _format_item_as_string(item: Any) -> str:
         return ", ".join(_format_item_as_string(i) for i in item)
     return str(item)
 
+def _non_empty_lists(series: pd.Series) -> pd.Series:
+    """
+    Returns the entries of a column that are non-empty lists, keeping the page number index.
+
+    Builds the mask from vectorized type and length checks; NaN and scalar entries fail the type check.
+    """
+    if series.dtype != object:
+        return series.iloc[:0] # A non-object column cannot hold any lists
+    mask = series.map(type).eq(list) & series.str.len().fillna(0).gt(0)
+    return series[mask]
+
+def _unique_formatted(items: list) -> list:
+    """
+    Formats the entries of one page's list as strings, dropping missing entries and repeats.
+
+    dict.fromkeys keeps the first occurrence of each string in its original order.
+    """
+    return list(dict.fromkeys(
+        _format_item_as_string(item) for item in items
+        if not (item is None or (isinstance(item, float) and np.isnan(item)))
+    ))
+
 def analyze_litigation(legal_df: pd.DataFrame) -> str:
     """
     Analyzes and summarizes litigation cases from the legal DataFrame.
@@ -36,30 +67,29 @@ def analyze_litigation(legal_df: pd.DataFrame) -> str:
         return "Litigation data column not found."
 
     # Filter for rows with valid litigation data (non-empty lists)
-    litigation_series = legal_df.dropna(subset=[col_name])
-    litigation_series = litigation_series[col_name][litigation_series[col_name].apply(lambda x: isinstance(x, list) and len(x) > 0)]
+    litigation_series = _non_empty_lists(legal_df[col_name])
 
     if litigation_series.empty:
         return "No litigation data found to analyze."
 
-    all_cases = []
-    # The index of the series is the page number
-    for page_num, cases_on_page in litigation_series.items():
-        for case_info in cases_on_page:
-            if isinstance(case_info, dict):
-                case = case_info.get('case', 'N/A')
-                impact = case_info.get('impact', 'Not specified')
-                all_cases.append({'case': case, 'impact': impact, 'page_number': page_num})
+    # Flatten to one row per case (the index stays the page number) and keep only dict entries
+    cases = litigation_series.explode()
+    cases = cases[cases.map(type).eq(dict)]
+    case_names = cases.str.get('case').fillna('N/A')
+    impacts = cases.str.get('impact').fillna('Not specified')
 
-    if not all_cases:
-        return "No valid litigation cases found after processing."
+    # Keep the first page each unique (case, impact) pair is mentioned on; a plain dict does the
+    # de-duplication without building a DataFrame for what is usually a handful of cases
+    first_seen = {}
+    for key, page_num in zip(zip(case_names, impacts), cases.index):
+        first_seen.setdefault(key, page_num)
 
-    # Create a DataFrame to handle duplicates and format output
-    cases_df = pd.DataFrame(all_cases).drop_duplicates(subset=['case', 'impact']).sort_values(by='page_number')
+    if not first_seen:
+        return "No valid litigation cases found after processing."
 
+    ordered_cases = sorted(first_seen.items(), key=lambda entry: entry[1])
     synthesis = "\n\n".join(
-        f"• Case: {row.case}\n  Impact: {row.impact} (Page {row.page_number})"
-        for row in cases_df.itertuples()
+        f"• Case: {case}\n  Impact: {impact} (Page {page_num})" for (case, impact), page_num in ordered_cases
     )
     return synthesis
 
@@ -77,25 +107,23 @@ def analyze_regulatory_matters(legal_df: pd.DataFrame) -> str:
     if col_name not in legal_df.columns:
         return "Regulatory Matters column not found."
 
-    # 1. Filter for rows with valid data, explode them, and keep the page number index
-    matters_df = legal_df.dropna(subset=[col_name])
-    matters_df = matters_df[matters_df[col_name].apply(lambda x: isinstance(x, list) and len(x) > 0)]
-    exploded_matters = matters_df[col_name].explode().dropna()
+    # 1. Filter for rows with valid data, format and de-duplicate each page's list before
+    # exploding it, and keep the page number index
+    exploded_matters = _non_empty_lists(legal_df[col_name]).map(_unique_formatted).explode().dropna()
 
     if exploded_matters.empty:
         return "No regulatory matters found."
 
-    # 2. Create a DataFrame of unique matters and their first-mentioned page number
-    # The AI returns strings for this field, so we can use them directly.
-    matters_with_pages = exploded_matters.reset_index().rename(columns={'index': 'page_number', col_name: 'matter'})
+    # 2. Keep the first page each matter was mentioned on.
+    # np.unique returns the matters sorted, with the position of each first occurrence
+    pages = exploded_matters.index.to_numpy()
+    unique_matters, first_positions = np.unique(exploded_matters.to_numpy(dtype=object), return_index=True)
 
-    # Convert 'matter' column to string to prevent sorting errors if it contains dicts
-    # and create a clean version for display
-    matters_with_pages['matter_str'] = matters_with_pages['matter'].apply(_format_item_as_string)
-    unique_matters_df = matters_with_pages.drop_duplicates(subset=['matter_str'], keep='first').sort_values(by='matter_str')
-    
     # 3. Build the formatted string with page numbers
-    synthesis = "\n\n".join(f"• {row.matter_str} (Page {row.page_number})" for row in unique_matters_df.itertuples())
+    synthesis = "\n\n".join(
+        f"• {matter} (Page {page})"
+        for matter, page in zip(unique_matters, pages[first_positions])
+    )
     return synthesis
 
 def summarize_corporate_governance(legal_df: pd.DataFrame) -> str:
@@ -113,16 +141,15 @@ def summarize_corporate_governance(legal_df: pd.DataFrame) -> str:
         return "Corporate Governance column not found."
 
     # Get all non-null, non-empty governance statements
-    governance_series = legal_df.dropna(subset=[col_name])[col_name]
-    # The index is the page number
-    governance_commentary = list(governance_series.items())
+    governance_series = legal_df[col_name].dropna()
 
-    if not governance_commentary:
+    if governance_series.empty:
         return "No corporate governance commentary found."
 
-    synthesis = "\n\n".join(
-        f"• {_format_item_as_string(text)} (Page {page_num})" for page_num, text in governance_commentary
-    )
+    # The index is the page number
+    entries = ("• " + governance_series.map(_format_item_as_string)
+               + " (Page " + governance_series.index.astype(str) + ")")
+    synthesis = entries.str.cat(sep="\n\n")
     return synthesis
 
 def run_legal_analysis(categorized_dfs: dict, print_to_console: bool = True) -> dict:
@@ -143,13 +170,19 @@ def run_legal_analysis(categorized_dfs: dict, print_to_console: bool = True) ->
             print("\n" + "="*50 + "\n--- Starting Legal Analysis ---\n" + "="*50)
         legal_df = categorized_dfs['Legal']
 
-        analysis_results['litigation_summary'] = analyze_litigation(legal_df)
+        # The three summaries are independent read-only passes over legal_df, so run them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            litigation_future = executor.submit(analyze_litigation, legal_df)
+            regulatory_future = executor.submit(analyze_regulatory_matters, legal_df)
+            governance_future = executor.submit(summarize_corporate_governance, legal_df)
+
+        analysis_results['litigation_summary'] = litigation_future.result()
         if print_to_console: print(f"\n--- Litigation Summary ---\n{analysis_results['litigation_summary']}")
 
-        analysis_results['regulatory_summary'] = analyze_regulatory_matters(legal_df)
+        analysis_results['regulatory_summary'] = regulatory_future.result()
         if print_to_console: print(f"\n--- Regulatory Matters Summary ---\n{analysis_results['regulatory_summary']}")
 
-        analysis_results['governance_summary'] = summarize_corporate_governance(legal_df)
+        analysis_results['governance_summary'] = governance_future.result()
         if print_to_console: print(f"\n--- Corporate Governance Commentary ---\n{analysis_results['governance_summary']}")
     else:
         print("\nNo 'Legal' data found to analyze.")
@@ -169,7 +202,7 @@ if __name__ == "__main__":
         pd.set_option('display.width', 150)
         pd.set_option('display.max_colwidth', 80)
 
-        _, categorized_dfs = create_analysis_dataframes(page_classifications)
+        _, categorized_dfs = create_analysis_dataframes(page_classifications, verbose=True)
 
         # Run the full analysis
         if categorized_dfs is not None:
@@ -199,7 +199,7 @@ def run_analysis_pipeline(analysis_types: list, financial_segments: list | None
     pd.set_option('display.width', 150)
     pd.set_option('display.max_colwidth', 80)
 
-    _, categorized_dfs = create_analysis_dataframes(page_classifications)
+    _, categorized_dfs = create_analysis_dataframes(page_classifications, verbose=print_to_console)
 
     if categorized_dfs is None:
         print("Error: Failed to create analysis dataframes.")
@@ -1,3 +1,5 @@
+import io
+import sys
 import pandas as pd
 import numpy as np
 from typing import Optional
@@ -5,6 +7,37 @@ from data_persistence import load_classification_data
 from financial_statement_analysis import create_analysis_dataframes
 
 
+def _non_null_items(df: pd.DataFrame, col_name: str) -> list:
+    """
+    Returns (index, value) pairs for the non-null values of a column.
+
+    Masks the column's arrays directly instead of building a dropna() copy of the DataFrame.
+    """
+    values = df[col_name].to_numpy()
+    mask = pd.notna(values)
+    if not mask.any():
+        return []
+    return list(zip(df.index.to_numpy()[mask], values[mask]))
+
+def _count_mentions(values: list, label: str, top_n: Optional[int] = None) -> pd.DataFrame:
+    """
+    Counts how often each value occurs, most mentioned first (ties keep first-seen order, like value_counts).
+
+    Args:
+        values (list): The values to count.
+        label (str): The column name for the values in the result.
+        top_n (int, optional): Only return the top_n most mentioned values.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the columns [label, 'Mentions'].
+    """
+    # factorize hashes the values to integer codes in first-seen order, so bincount can do the
+    # counting in C and a stable sort on the counts keeps ties in first-seen order
+    codes, names = pd.factorize(np.asarray(values, dtype=object))
+    counts = np.bincount(codes)
+    order = np.argsort(-counts, kind='stable')[:top_n]
+    return pd.DataFrame({label: names[order], 'Mentions': counts[order]})
+
 def analyze_business_segments(op_risk_df: pd.DataFrame, segments_to_include: Optional[list] = None) -> pd.DataFrame:
     """
     Analyzes and summarizes business segment data from the operational and risk DataFrame.
@@ -28,23 +61,20 @@ def analyze_business_segments(op_risk_df: pd.DataFrame, segments_to_include: Opt
 
     def extract_segments_from_series(series: pd.Series):
         """Helper to extract segment names from a series containing lists of strings or dicts."""
+        # Single pass over the raw values: non-list cells are skipped, dicts contribute their 'name'
         segments = []
-        # Drop rows with None, NaN, or empty lists
-        series = series.dropna()
-        series = series[series.apply(lambda x: isinstance(x, list) and len(x) > 0)]
-        
-        if not series.empty:
-            exploded = series.explode()
-            # Check if the first valid item is a dictionary with 'name'
-            first_item = exploded.dropna().iloc[0]
-            if isinstance(first_item, dict) and 'name' in first_item:
-                # Handle list of dictionaries
-                normalized = pd.json_normalize(exploded.tolist())
-                if 'name' in normalized.columns:
-                    segments.extend(normalized['name'].dropna().tolist())
-            else:
-                # Handle list of strings
-                segments.extend(exploded.dropna().astype(str).tolist())
+        append = segments.append
+        for value in series.values:
+            # None and empty lists are falsy, so they are skipped before the type check
+            if not value or not isinstance(value, list):
+                continue
+            for item in value:
+                if isinstance(item, dict):
+                    name = item.get('name')
+                    if name is not None:
+                        append(name)
+                elif not pd.isna(item):
+                    append(str(item))
         return segments
 
     # Process both columns and aggregate the results
@@ -58,9 +88,7 @@ def analyze_business_segments(op_risk_df: pd.DataFrame, segments_to_include: Opt
         return pd.DataFrame()
 
     # Count mentions of each segment and return as a DataFrame
-    summary = pd.Series(all_segments_list).value_counts().reset_index()
-    summary.columns = ['Business Segment', 'Mentions']
-    return summary
+    return _count_mentions(all_segments_list, 'Business Segment')
 
 def analyze_competitive_landscape(op_risk_df: pd.DataFrame) -> dict:
     """
@@ -82,14 +110,19 @@ def analyze_competitive_landscape(op_risk_df: pd.DataFrame) -> dict:
 
     # Extract competitors
     if competitors_col in op_risk_df.columns:
-        # Explode lists, drop nulls, get unique values
-        all_competitors = op_risk_df.dropna(subset=[competitors_col])[competitors_col].explode().dropna().unique()
-        results["identified_competitors"] = sorted(list(all_competitors))
+        # Collect unique, non-null names straight into a set (single values count as one competitor)
+        all_competitors = set()
+        for competitors in op_risk_df[competitors_col].values:
+            if isinstance(competitors, list):
+                all_competitors.update(c for c in competitors if not pd.isna(c))
+            elif not pd.isna(competitors):
+                all_competitors.add(competitors)
+        results["identified_competitors"] = sorted(all_competitors)
 
     # Extract market position statements
     if market_pos_col in op_risk_df.columns:
-        all_statements = op_risk_df.dropna(subset=[market_pos_col])[market_pos_col].unique()
-        results["market_position_statements"] = list(all_statements)
+        all_statements = pd.unique(op_risk_df[market_pos_col].values)
+        results["market_position_statements"] = [stmt for stmt in all_statements if not pd.isna(stmt)]
         
     return results
 
@@ -109,14 +142,12 @@ def synthesize_mda(op_risk_df: pd.DataFrame) -> str:
     performance_commentary = []
     if perf_col in op_risk_df.columns:
         # Create a list of (page_number, text) tuples
-        perf_series = op_risk_df.dropna(subset=[perf_col])[perf_col]
-        performance_commentary = list(perf_series.items())
+        performance_commentary = _non_null_items(op_risk_df, perf_col)
 
     forward_looking = []
     if outlook_col in op_risk_df.columns:
         # Create a list of (page_number, text) tuples
-        outlook_series = op_risk_df.dropna(subset=[outlook_col])[outlook_col]
-        forward_looking = list(outlook_series.items())
+        forward_looking = _non_null_items(op_risk_df, outlook_col)
 
     if not performance_commentary and not forward_looking:
         return "No MD&A commentary found."
@@ -127,11 +158,11 @@ def synthesize_mda(op_risk_df: pd.DataFrame) -> str:
 
     if performance_commentary:
         synthesis += "\n--- Commentary on Performance ---\n"
-        synthesis += "\n\n".join(f"• {text} (Page {page_num})" for page_num, text in performance_commentary) + "\n"
+        synthesis += "\n\n".join(["• %s (Page %s)" % (text, page_num) for page_num, text in performance_commentary]) + "\n"
 
     if forward_looking:
         synthesis += "\n--- Forward-Looking Statements ---\n"
-        synthesis += "\n\n".join(f"• {text} (Page {page_num})" for page_num, text in forward_looking) + "\n"
+        synthesis += "\n\n".join(["• %s (Page %s)" % (text, page_num) for page_num, text in forward_looking]) + "\n"
 
     return synthesis
 
@@ -149,20 +180,21 @@ def compile_key_risks(op_risk_df: pd.DataFrame) -> str:
     if col_name not in op_risk_df.columns:
         return "Key risks column not found."
 
-    # 1. Filter for rows with valid risk data and explode them, keeping the page number index
-    risks_df = op_risk_df.dropna(subset=[col_name])
-    risks_df = risks_df[risks_df[col_name].apply(lambda x: isinstance(x, list) and len(x) > 0)]
-    exploded_risks = risks_df[col_name].explode().dropna()
-
-    if exploded_risks.empty:
+    # 1. Single pass over (page number, risk list) pairs, keeping the first page each unique risk is mentioned on
+    first_mention = {}
+    for page_number, risks in zip(op_risk_df.index.values, op_risk_df[col_name].values):
+        if not risks or not isinstance(risks, list):
+            continue
+        for risk in risks:
+            if pd.isna(risk) or risk in first_mention:
+                continue
+            first_mention[risk] = page_number
+
+    if not first_mention:
         return "No valid risks found after processing."
 
-    # 2. Create a DataFrame of unique risks and their first-mentioned page number
-    risks_with_pages = exploded_risks.reset_index().rename(columns={'index': 'page_number', col_name: 'risk'})
-    unique_risks_df = risks_with_pages.drop_duplicates(subset=['risk'], keep='first').sort_values(by='risk')
-
-    # 3. Build the formatted string with page numbers
-    synthesis = "\n\n".join(f"• {row.risk} (Page {row.page_number})" for row in unique_risks_df.itertuples())
+    # 2. Build the formatted string with page numbers, ordered by risk
+    synthesis = "\n\n".join(["• %s (Page %s)" % item for item in sorted(first_mention.items())])
     return synthesis
 
 def analyze_geographic_exposure(op_risk_df: pd.DataFrame) -> pd.DataFrame:
@@ -181,24 +213,27 @@ def analyze_geographic_exposure(op_risk_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Drop rows where the geographic data is missing/null
-    geo_df = op_risk_df.dropna(subset=[col_name])
-    if geo_df.empty:
+    geo_values = op_risk_df[col_name].to_numpy()
+    geo_values = geo_values[pd.notna(geo_values)]
+    if geo_values.size == 0:
         print("No geographic exposure data found to analyze.")
         return pd.DataFrame()
 
     # The AI is returning a list of strings, not a list of dicts.
-    # We can directly explode the list and use the values.
-    exploded_series = geo_df[col_name].explode().dropna()
+    # Flatten the lists (single values count as one region) and drop nulls.
+    regions = []
+    for value in geo_values:
+        if isinstance(value, list):
+            regions.extend(region for region in value if not pd.isna(region))
+        else:
+            regions.append(value)
 
-    if exploded_series.empty:
+    if not regions:
         print("No valid geographic regions found after processing.")
         return pd.DataFrame()
 
     # Count mentions of each region and return as a DataFrame, ordered by mentions
-    summary = exploded_series.value_counts().reset_index()
-    summary.columns = ['Region of Operation', 'Mentions']
-    
-    return summary.head(10)
+    return _count_mentions(regions, 'Region of Operation', top_n=10)
 
 def run_operational_risk_analysis(categorized_dfs: dict, print_to_console: bool = True) -> dict:
     """
@@ -214,42 +249,48 @@ def run_operational_risk_analysis(categorized_dfs: dict, print_to_console: bool
         dict: A dictionary containing all the analysis results.
     """
     analysis_results = {}
+    # Console output is collected here and written in one go at the end
+    console = io.StringIO()
     if 'Operational and Risk' in categorized_dfs:
         if print_to_console:
-            print("\n" + "="*50 + "\n--- Starting Operational and Risk Analysis ---\n" + "="*50)
+            print("\n" + "="*50 + "\n--- Starting Operational and Risk Analysis ---\n" + "="*50, file=console)
         op_risk_df = categorized_dfs['Operational and Risk']
 
         # 1. Analyze Business Segments and store
         analysis_results['segment_summary'] = analyze_business_segments(op_risk_df)
         if print_to_console:
-            print("\n--- Business Segment Summary ---")
-            print(analysis_results['segment_summary'].to_string())
+            print("\n--- Business Segment Summary ---", file=console)
+            print(analysis_results['segment_summary'].to_string(), file=console)
 
         # 2. Analyze Competitive Landscape and store
         analysis_results['competition_summary'] = analyze_competitive_landscape(op_risk_df)
         if print_to_console:
-            print("\n--- Competitive Landscape ---")
-            print(f"Identified Competitors: {analysis_results['competition_summary']['identified_competitors']}")
-            print("\nMarket Position Statements:")
+            print("\n--- Competitive Landscape ---", file=console)
+            print(f"Identified Competitors: {analysis_results['competition_summary']['identified_competitors']}", file=console)
+            print("\nMarket Position Statements:", file=console)
             for stmt in analysis_results['competition_summary']['market_position_statements']:
-                print(f"- {stmt}")
+                print(f"- {stmt}", file=console)
 
         # 3. Synthesize MD&A and store
         analysis_results['mda_summary'] = synthesize_mda(op_risk_df)
-        if print_to_console: print(f"\n{analysis_results['mda_summary']}")
+        if print_to_console: print(f"\n{analysis_results['mda_summary']}", file=console)
 
         # 4. Compile Key Risks and store
         analysis_results['risks_summary'] = compile_key_risks(op_risk_df)
-        if print_to_console: print(f"\n--- Key Risks Summary ---\n{analysis_results['risks_summary']}")
+        if print_to_console: print(f"\n--- Key Risks Summary ---\n{analysis_results['risks_summary']}", file=console)
 
         # 5. Analyze Geographic Exposure and store
         analysis_results['geo_summary'] = analyze_geographic_exposure(op_risk_df)
         if print_to_console:
-            print("\n--- Geographic Exposure Summary ---")
-            print("(Showing top 10 most mentioned regions)")
-            print(analysis_results['geo_summary'].to_string())
+            print("\n--- Geographic Exposure Summary ---", file=console)
+            print("(Showing top 10 most mentioned regions)", file=console)
+            print(analysis_results['geo_summary'].to_string(), file=console)
     else:
         print("\nNo 'Operational and Risk' data found to analyze.")
+
+    if print_to_console:
+        sys.stdout.write(console.getvalue())
+        sys.stdout.flush()
     
     return analysis_results
 
@@ -267,7 +308,7 @@ if __name__ == "__main__":
         pd.set_option('display.max_colwidth', 80)
 
         # Create the main and categorized DataFrames
-        main_df, categorized_dfs = create_analysis_dataframes(page_classifications)
+        main_df, categorized_dfs = create_analysis_dataframes(page_classifications, verbose=True)
 
         # Run the analysis using the new function
         if categorized_dfs is not None:
@@ -4,85 +4,256 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.colors import black, blue, lightgrey, grey, white
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
 from datetime import datetime
+from types import SimpleNamespace
+import re
+import textwrap
+from xml.sax.saxutils import escape
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from PyPDF2 import PdfWriter
 import pandas as pd
 
+# Body cells longer than this are wrapped in a Paragraph so they can line-wrap;
+# shorter ones are drawn as plain strings, which skips ReportLab's paragraph layout.
+MAX_PLAIN_CELL_CHARS = 60
+
+# Classified pages drawn per canvas part of the classification report; each part is finished
+# and serialised before the next starts
+CLASSIFICATION_ENTRIES_PER_PART = 50
+
+# Free text longer than this is split at blank lines into several Paragraphs
+MAX_SINGLE_PARAGRAPH_CHARS = 2000
+
+# Table header names are wrapped onto lines of at most this many characters.
+MAX_HEADER_LINE_CHARS = 16
+
+# Analysis report sections in the order they appear in the PDF, mapped to the method that renders them.
+ANALYSIS_SECTIONS = {
+    'financial': '_add_financial_analysis_section',
+    'operational': '_add_operational_analysis_section',
+    'debt': '_add_debt_analysis_section',
+    'legal': '_add_legal_analysis_section',
+}
+
+# Page margins shared by the platypus templates and the canvas-drawn sections.
+TOP_MARGIN = 1*inch
+BOTTOM_MARGIN = 1*inch
+LEFT_MARGIN = 0.75*inch
+RIGHT_MARGIN = 0.75*inch
+
+def _new_doc_template(target):
+    """Creates the page template shared by every report (and every report part)."""
+    return SimpleDocTemplate(target, pagesize=A4, topMargin=TOP_MARGIN, bottomMargin=BOTTOM_MARGIN, leftMargin=LEFT_MARGIN, rightMargin=RIGHT_MARGIN)
+
+def render_section(section_name: str, data) -> bytes:
+    """
+    Renders a single analysis section into an in-memory PDF.
+
+    Kept at module level so it can run in a worker process; each call builds its
+    own ReportGenerator.
+    """
+    buffer = BytesIO()
+    generator = ReportGenerator(buffer)
+    getattr(generator, ANALYSIS_SECTIONS[section_name])(data)
+    generator.doc.build(generator.story)
+    return buffer.getvalue()
+
+def _draw_labelled_line(canv, x, y, width, label, text, font_size=10):
+    """
+    Draws "label text" starting at (x, y), with the label in bold, wrapping the text within width.
+
+    Returns the y position below the last line drawn.
+    """
+    leading = font_size * 1.2
+    label_width = stringWidth(label, 'Helvetica-Bold', font_size) if label else 0
+    wrapped = simpleSplit(text, 'Helvetica', font_size, width - label_width) or ['']
+    for i, line in enumerate(wrapped):
+        if y < BOTTOM_MARGIN:
+            canv.showPage()
+            y = A4[1] - TOP_MARGIN
+        if i == 0 and label:
+            canv.setFont('Helvetica-Bold', font_size)
+            canv.drawString(x, y, label)
+        canv.setFont('Helvetica', font_size)
+        canv.drawString(x + label_width, y, line)
+        y -= leading
+    return y
+
+def render_classification_pages(page_entries: list, include_heading: bool = True) -> bytes:
+    """
+    Renders a batch of "Classification Results by Page" entries directly on a canvas.
+
+    The per-page entries only need simple text layout, so this avoids building a
+    flowable for every classified page; pages are emitted as soon as they fill up.
+    """
+    buffer = BytesIO()
+    canv = canvas.Canvas(buffer, pagesize=A4)
+    x = LEFT_MARGIN
+    width = A4[0] - LEFT_MARGIN - RIGHT_MARGIN
+    y = A4[1] - TOP_MARGIN
+
+    if include_heading:
+        canv.setFont('Helvetica-Bold', 18)
+        canv.setFillColor(blue)
+        canv.drawString(x, y - 18, "2. Classification Results by Page")
+        canv.setFillColor(black)
+        y -= 18 + 6 + 12
+
+    indent = stringWidth('    ', 'Helvetica', 10)
+    for data in page_entries:
+        y = _draw_labelled_line(canv, x, y, width, f"Page {data['page_number']} - {data['category']}", "")
+        y = _draw_labelled_line(canv, x, y, width, "Overall Focus: ", str(data['overall_focus']))
+        y = _draw_labelled_line(canv, x, y, width, "Reasoning Points:", "")
+        for i, point in enumerate(data['reasoning_points'], 1):
+            y = _draw_labelled_line(canv, x + indent, y, width - indent, "", f"{i}. {point}")
+
+        metrics = data.get('key_metrics', {})
+        if 'business_segment' in metrics and metrics['business_segment']:
+            y = _draw_labelled_line(canv, x, y, width, "Identified Business Segment(s):", "")
+            y = _draw_labelled_line(canv, x + indent, y, width - indent, "", f"• {', '.join(metrics['business_segment'])}")
+        y -= 12
+
+    canv.save()
+    return buffer.getvalue()
+
+def _escape_with_breaks(text: str) -> str:
+    """Escapes text for Paragraph markup and turns newlines into <br/> tags."""
+    return escape(text).replace('\n', '<br/>')
+
+def _iter_bullets(text: str):
+    """
+    Yields each blank-line separated bullet in text on a single line.
+
+    Entries are split only at blank lines, so a '•' inside an entry stays part of it, and any
+    text before the first bullet (e.g. a "No ... found." message) is yielded as its own entry.
+    """
+    for entry in text.split('\n\n'):
+        yield ' '.join(line.strip() for line in entry.strip().splitlines())
+
+def _build_styles():
+    """Defines custom paragraph and table styles for the reports."""
+    sample = getSampleStyleSheet()
+    normal = sample['Normal']
+    body = sample['BodyText']
+    return SimpleNamespace(
+        title=ParagraphStyle('CustomTitle', parent=sample['Title'], fontSize=24, textColor=blue, alignment=TA_CENTER, spaceAfter=20),
+        h1=ParagraphStyle('CustomH1', parent=sample['Heading1'], fontSize=18, textColor=blue, spaceBefore=12, spaceAfter=6),
+        h2=ParagraphStyle('CustomH2', parent=sample['Heading2'], fontSize=14, textColor=blue, spaceBefore=10, spaceAfter=4),
+        h3=ParagraphStyle('CustomH3', parent=sample['Heading3'], fontSize=12, textColor=black, spaceBefore=8, spaceAfter=4),
+        body=body,
+        bullet=ParagraphStyle('Bullet', parent=body, firstLineIndent=0, leftIndent=18, spaceBefore=2, spaceAfter=4),
+        italic=sample['Italic'],
+        normal=normal,
+        table_cell=ParagraphStyle('ReportTableCell', parent=normal, alignment=TA_CENTER),
+    )
+
+# The styles never change between reports, so they are built once at import and shared
+_STYLES = _build_styles()
+
 class ReportGenerator:
     """A class to generate professional PDF reports from analysis data."""
 
     def __init__(self, output_path):
         """Initializes the report generator with an output path and default styles."""
         self.output_path = output_path
-        self.doc = SimpleDocTemplate(output_path, pagesize=A4, topMargin=1*inch, leftMargin=0.75*inch, rightMargin=0.75*inch)
+        self.doc = _new_doc_template(output_path)
         self.story = []
-        self.styles = getSampleStyleSheet()
-        self._define_styles()
-
-    def _define_styles(self):
-        """Defines custom paragraph and table styles for the reports."""
-        self.title_style = ParagraphStyle('CustomTitle', parent=self.styles['Title'], fontSize=24, textColor=blue, alignment=TA_CENTER, spaceAfter=20)
-        self.h1_style = ParagraphStyle('CustomH1', parent=self.styles['Heading1'], fontSize=18, textColor=blue, spaceBefore=12, spaceAfter=6)
-        self.h2_style = ParagraphStyle('CustomH2', parent=self.styles['Heading2'], fontSize=14, textColor=blue, spaceBefore=10, spaceAfter=4)
-        self.h3_style = ParagraphStyle('CustomH3', parent=self.styles['Heading3'], fontSize=12, textColor=black, spaceBefore=8, spaceAfter=4)
-        self.body_style = self.styles['BodyText']
-        self.bullet_style = ParagraphStyle('Bullet', parent=self.body_style, firstLineIndent=0, leftIndent=18, spaceBefore=2, spaceAfter=4)
-        self.italic_style = self.styles['Italic']
-        self.normal_style = self.styles['Normal']
+        self.section_parts = []
+        self.styles = _STYLES
 
     def _df_to_reportlab_table(self, df: pd.DataFrame):
         """Converts a pandas DataFrame to a ReportLab Table object."""
         if df is None or df.empty:
             return None
 
-        header_style = ParagraphStyle('ReportTableHeader', parent=self.normal_style, fontName='Helvetica-Bold', textColor=white, alignment=TA_CENTER)
-        cell_style = ParagraphStyle('ReportTableCell', parent=self.normal_style, alignment=TA_CENTER)
-
         df_reset = df.reset_index()
-        header = [Paragraph(str(col), header_style) for col in df_reset.columns] # Original line
-
-        # Format body cells, rounding numbers to 2 decimal places
-        formatted_body = []
-        for row in df_reset.values:
-            formatted_row = []
-            for cell in row:
-                if isinstance(cell, (int, float)):
-                    formatted_row.append(Paragraph(f"{cell:,.2f}", cell_style))
-                else:
-                    formatted_row.append(Paragraph(str(cell), cell_style))
-            formatted_body.append(formatted_row)
+        # Plain strings (styled through the TableStyle below); long names are broken onto
+        # several lines so wide tables still fit the page
+        header = [textwrap.fill(str(col), MAX_HEADER_LINE_CHARS) for col in df_reset.columns]
+
+        # Format body cells block-wise: numeric columns rounded to 2 decimal places, the rest as text.
+        # Going through object keeps missing values as 'None'/'nan' strings, since astype(str) on
+        # pandas 3 leaves them as NaN
+        num_block = df_reset.select_dtypes(include='number')
+        str_block = df_reset.drop(columns=num_block.columns).astype(object).map(str)
+        formatted = pd.concat([num_block.map("{:,.2f}".format), str_block], axis=1)[df_reset.columns]
+
+        cell_style = self.styles.table_cell
+        formatted_body = [
+            [Paragraph(cell, cell_style) if len(cell) > MAX_PLAIN_CELL_CHARS else cell for cell in row]
+            for row in formatted.to_numpy().tolist()
+        ]
         data = [header] + formatted_body
 
         table = Table(data, repeatRows=1)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), grey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('TEXTCOLOR', (0, 0), (-1, 0), white),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('BACKGROUND', (0, 1), (-1, -1), 'white'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('GRID', (0, 0), (-1, -1), 1, lightgrey)
         ]))
         return table
 
+    def _append_bullets(self, text: str):
+        """Appends each blank-line separated bullet in text to the story as it is parsed, skipping empty entries."""
+        for bullet in _iter_bullets(text):
+            if bullet:
+                self.story.append(Paragraph(bullet, self.styles.bullet))
+
+    def _append_text_block(self, text: str):
+        """
+        Appends free text to the story as body paragraphs, keeping its line breaks.
+
+        The text is escaped so stray '&' or '<' characters can't break ReportLab's markup
+        parser. Long text is split at blank lines into several Paragraphs, since line-breaking
+        one very long Paragraph is much slower than several short ones.
+        """
+        chunks = text.split('\n\n') if len(text) > MAX_SINGLE_PARAGRAPH_CHARS else [text]
+        for chunk in chunks:
+            if chunk.strip():
+                self.story.append(Paragraph(_escape_with_breaks(chunk), self.styles.body))
+
     def build(self):
-        """Builds the PDF document from the story."""
-        self.doc.build(self.story)
+        """Builds the PDF document from the story, followed by any pre-rendered section parts."""
+        if not self.section_parts:
+            self.doc.build(self.story)
+        else:
+            story_buffer = BytesIO()
+            _new_doc_template(story_buffer).build(self.story)
+            writer = PdfWriter()
+            for part in [story_buffer.getvalue(), *self.section_parts]:
+                writer.append(BytesIO(part))
+            with open(self.output_path, 'wb') as output_file:
+                writer.write(output_file)
         print(f"PDF report generated: {self.output_path}")
 
     def generate_classification_report(self, page_classifications):
         """Generates the content for the classification report."""
         # Title page
-        self.story.append(Paragraph("PDF Classification Analysis Report", self.title_style))
+        self.story.append(Paragraph("PDF Classification Analysis Report", self.styles.title))
         self.story.append(Spacer(1, 0.5*inch))
-        self.story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.normal_style))
-        self.story.append(Paragraph(f"Total Pages Analyzed: {len(page_classifications)}", self.normal_style))
+        self.story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.styles.normal))
+        self.story.append(Paragraph(f"Total Pages Analyzed: {len(page_classifications)}", self.styles.normal))
         self.story.append(PageBreak())
 
         # Executive Summary
-        self.story.append(Paragraph("1. Executive Summary", self.h1_style))
-        category_stats = pd.Series([d['category'] for d in page_classifications.values()]).value_counts()
-        summary_data = [['Category', 'Page Count', 'Percentage']]
+        self.story.append(Paragraph("1. Executive Summary", self.styles.h1))
+        category_stats = Counter(data['category'] for data in page_classifications.values())
         total_pages = len(page_classifications)
-        for category, count in category_stats.items():
-            percentage = (count / total_pages) * 100
-            summary_data.append([str(category), str(count), f"{percentage:.1f}%"])
+        summary_data = [['Category', 'Page Count', 'Percentage']] + [
+            [str(category), str(count), f"{count / total_pages * 100:.1f}%"]
+            for category, count in category_stats.most_common()
+        ]
         
         summary_table = Table(summary_data, colWidths=[3*inch, 1*inch, 1*inch])
         summary_table.setStyle(TableStyle([
@@ -92,109 +263,102 @@ class ReportGenerator:
             ('BACKGROUND', (0, 1), (-1, -1), 'white'), ('GRID', (0, 0), (-1, -1), 1, black)
         ]))
         self.story.append(summary_table)
-        self.story.append(PageBreak())
 
         # Detailed Results
-        self.story.append(Paragraph("2. Classification Results by Page", self.h1_style))
-        for page_idx in sorted(page_classifications.keys()):
-            data = page_classifications[page_idx]
-            self.story.append(Paragraph(f"Page {data['page_number']} - {data['category']}", self.h2_style))
-            self.story.append(Paragraph(f"<b>Overall Focus:</b> {data['overall_focus']}", self.normal_style))
-            self.story.append(Spacer(1, 6))
-            self.story.append(Paragraph("<b>Reasoning Points:</b>", self.normal_style))
-            for i, point in enumerate(data['reasoning_points'], 1):
-                self.story.append(Paragraph(f"{i}. {point}", self.bullet_style))
-            
-            metrics = data.get('key_metrics', {})
-            if 'business_segment' in metrics and metrics['business_segment']:
-                self.story.append(Spacer(1, 6))
-                self.story.append(Paragraph("<b>Identified Business Segment(s):</b>", self.normal_style))
-                self.story.append(Paragraph(f"• {', '.join(metrics['business_segment'])}", self.bullet_style))
-            self.story.append(Spacer(1, 12))
+        # Drawn straight onto a canvas in batches of CLASSIFICATION_ENTRIES_PER_PART and merged
+        # after the summary in build(), so at most one batch of pages is held by a canvas at a time
+        entries = [data for _, data in sorted(page_classifications.items())]
+        self.section_parts = [
+            render_classification_pages(entries[start:start + CLASSIFICATION_ENTRIES_PER_PART], include_heading=(start == 0))
+            for start in range(0, max(len(entries), 1), CLASSIFICATION_ENTRIES_PER_PART)
+        ]
 
     def generate_analysis_report(self, analysis_results: dict):
         """Generates the content for the full analysis report."""
         # Title Page
-        self.story.append(Paragraph("10-K Document Analysis Report", self.title_style))
+        self.story.append(Paragraph("10-K Document Analysis Report", self.styles.title))
         self.story.append(Spacer(1, 0.25*inch))
-        self.story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.normal_style))
+        self.story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.styles.normal))
         self.story.append(PageBreak())
 
         # --- Sections ---
-        self._add_financial_analysis_section(analysis_results.get('financial'))
-        self._add_operational_analysis_section(analysis_results.get('operational'))
-        self._add_debt_analysis_section(analysis_results.get('debt'))
-        self._add_legal_analysis_section(analysis_results.get('legal'))
+        # Each section is laid out in its own process and merged after the title page in build()
+        sections = [(name, analysis_results[name]) for name in ANALYSIS_SECTIONS if analysis_results.get(name)]
+        if sections:
+            with ProcessPoolExecutor(max_workers=len(sections)) as executor:
+                self.section_parts = list(executor.map(render_section, *zip(*sections)))
 
     def _add_financial_analysis_section(self, fin_data):
         if not fin_data: return
-        self.story.append(Paragraph("Financial Analysis", self.h1_style))
-        
-        if fin_data.get('reconstructed_statements'):
-            self.story.append(Paragraph("Reconstructed Financial Statements", self.h2_style))
-            for name, df in fin_data['reconstructed_statements'].items():
-                self.story.append(Paragraph(name, self.h3_style))
-                table = self._df_to_reportlab_table(df)
-                if table: self.story.extend([table, Spacer(1, 12)])
+        self.story.append(Paragraph("Financial Analysis", self.styles.h1))
         
-        if fin_data.get('financial_ratios'):
-            self.story.append(Paragraph("Financial Ratios", self.h2_style))
-            for name, df in fin_data['financial_ratios'].items():
-                self.story.append(Paragraph(name, self.h3_style))
-                table = self._df_to_reportlab_table(df)
-                if table: self.story.extend([table, Spacer(1, 12)])
-
-        if 'cash_flow_summary' in fin_data and not fin_data['cash_flow_summary'].empty:
-            self.story.append(Paragraph("Cash Flow Summary", self.h2_style))
-            table = self._df_to_reportlab_table(fin_data['cash_flow_summary'])
-            if table: self.story.extend([table, Spacer(1, 12)])
+        subsections = [
+            ('reconstructed_statements', "Reconstructed Financial Statements", self._render_df_dict),
+            ('financial_ratios', "Financial Ratios", self._render_df_dict),
+            ('cash_flow_summary', "Cash Flow Summary", self._render_single_df),
+        ]
+        for key, title, render in subsections:
+            value = fin_data.get(key)
+            # Skip missing or empty results (empty dicts and empty DataFrames alike)
+            if value is None or (value.empty if isinstance(value, pd.DataFrame) else not value):
+                continue
+            self.story.append(Paragraph(title, self.styles.h2))
+            render(value)
         
         self.story.append(PageBreak())
 
+    def _render_df_dict(self, dfs: dict):
+        """Renders each named DataFrame as an h3 heading followed by its table."""
+        for name, df in dfs.items():
+            self.story.append(Paragraph(name, self.styles.h3))
+            self._render_single_df(df)
+
+    def _render_single_df(self, df: pd.DataFrame):
+        """Renders a DataFrame as a table followed by a spacer."""
+        table = self._df_to_reportlab_table(df)
+        if table: self.story.extend([table, Spacer(1, 12)])
+
     def _add_operational_analysis_section(self, op_data):
         if not op_data: return
-        self.story.append(Paragraph("Operational and Risk Analysis", self.h1_style))
+        self.story.append(Paragraph("Operational and Risk Analysis", self.styles.h1))
 
         if 'segment_summary' in op_data and not op_data['segment_summary'].empty:
-            self.story.append(Paragraph("Business Segment Summary", self.h2_style))
+            self.story.append(Paragraph("Business Segment Summary", self.styles.h2))
             table = self._df_to_reportlab_table(op_data['segment_summary'])
             if table: self.story.extend([table, Spacer(1, 12)])
 
         if 'competition_summary' in op_data:
-            self.story.append(Paragraph("Competitive Landscape", self.h2_style))
-            self.story.append(Paragraph(f"<b>Identified Competitors:</b> {', '.join(op_data['competition_summary'].get('identified_competitors', []))}", self.body_style))
+            self.story.append(Paragraph("Competitive Landscape", self.styles.h2))
+            self.story.append(Paragraph(f"<b>Identified Competitors:</b> {', '.join(op_data['competition_summary'].get('identified_competitors', []))}", self.styles.body))
             self.story.append(Spacer(1, 6))
-            self.story.append(Paragraph("<b>Market Position Statements:</b>", self.body_style))
+            self.story.append(Paragraph("<b>Market Position Statements:</b>", self.styles.body))
             for stmt in op_data['competition_summary'].get('market_position_statements', []):
-                self.story.append(Paragraph(f"• {stmt}", self.bullet_style))
+                self.story.append(Paragraph(f"• {stmt}", self.styles.bullet))
             self.story.append(Spacer(1, 12))
 
         if 'risks_summary' in op_data:
-            self.story.append(Paragraph("Key Risks Summary", self.h2_style))
-            for risk in op_data['risks_summary'].split('\n\n'):
-                if risk.strip():
-                    self.story.append(Paragraph(risk.strip(), self.bullet_style))
+            self.story.append(Paragraph("Key Risks Summary", self.styles.h2))
+            self._append_bullets(op_data['risks_summary'])
             self.story.append(Spacer(1, 12))
 
         if 'geo_summary' in op_data and not op_data['geo_summary'].empty:
-            self.story.append(Paragraph("Geographic Exposure Summary", self.h2_style))
-            self.story.append(Paragraph("(Top 10 most mentioned regions)", self.italic_style))
+            self.story.append(Paragraph("Geographic Exposure Summary", self.styles.h2))
+            self.story.append(Paragraph("(Top 10 most mentioned regions)", self.styles.italic))
             table = self._df_to_reportlab_table(op_data['geo_summary'])
             if table: self.story.extend([table, Spacer(1, 12)])
 
         if 'mda_summary' in op_data:
-            self.story.append(Paragraph("Management Discussion & Analysis", self.h2_style))
+            self.story.append(Paragraph("Management Discussion & Analysis", self.styles.h2))
             
             full_mda_text = op_data['mda_summary'].strip()
             
             # Use regex to find all sub-headers and their content blocks
-            import re
             header_pattern = re.compile(r'--- (.*?) ---')
             matches = list(header_pattern.finditer(full_mda_text))
 
             if not matches:
                 # Fallback if no headers are found (should not happen with current synthesize_mda)
-                self.story.append(Paragraph(full_mda_text.replace('\n', '<br/>'), self.body_style))
+                self._append_text_block(full_mda_text)
             else:
                 for i, match in enumerate(matches):
                     header_text = match.group(1).strip()
@@ -206,12 +370,10 @@ class ReportGenerator:
                     content_block = full_mda_text[content_start:content_end].strip()
 
                     # Add the sub-header
-                    self.story.append(Paragraph(header_text, self.h3_style))
+                    self.story.append(Paragraph(header_text, self.styles.h3))
                     
                     # Add the bullet points for this sub-section
-                    for bullet_point in content_block.split('\n\n'):
-                        if bullet_point.strip():
-                            self.story.append(Paragraph(bullet_point.strip(), self.bullet_style))
+                    self._append_bullets(content_block)
             
             self.story.append(Spacer(1, 12))
 
@@ -219,16 +381,15 @@ class ReportGenerator:
 
     def _add_debt_analysis_section(self, debt_data):
         if not debt_data: return
-        self.story.append(Paragraph("Debt and Capital Structure Analysis", self.h1_style))
+        self.story.append(Paragraph("Debt and Capital Structure Analysis", self.styles.h1))
 
         if 'covenants' in debt_data:
-            self.story.append(Paragraph("Debt Covenants", self.h2_style))
-            for cov in debt_data['covenants'].split('\n\n'):
-                if cov.strip(): self.story.append(Paragraph(cov.strip(), self.bullet_style))
+            self.story.append(Paragraph("Debt Covenants", self.styles.h2))
+            self._append_bullets(debt_data['covenants'])
             self.story.append(Spacer(1, 12))
 
         if 'capital_structure' in debt_data and not debt_data['capital_structure'].empty:
-            self.story.append(Paragraph("Capital Structure Summary", self.h2_style))
+            self.story.append(Paragraph("Capital Structure Summary", self.styles.h2))
             table = self._df_to_reportlab_table(debt_data['capital_structure'])
             if table: self.story.extend([table, Spacer(1, 12)])
 
@@ -236,21 +397,19 @@ class ReportGenerator:
 
     def _add_legal_analysis_section(self, legal_data):
         if not legal_data: return
-        self.story.append(Paragraph("Legal Analysis", self.h1_style))
+        self.story.append(Paragraph("Legal Analysis", self.styles.h1))
 
         if 'litigation_summary' in legal_data:
-            self.story.append(Paragraph("Litigation Summary", self.h2_style))
-            self.story.append(Paragraph(legal_data['litigation_summary'].replace('\n', '<br/>'), self.body_style))
+            self.story.append(Paragraph("Litigation Summary", self.styles.h2))
+            self._append_text_block(legal_data['litigation_summary'])
             self.story.append(Spacer(1, 12))
 
         if 'regulatory_summary' in legal_data:
-            self.story.append(Paragraph("Regulatory Matters", self.h2_style))
-            for matter in legal_data['regulatory_summary'].split('\n\n'):
-                if matter.strip(): self.story.append(Paragraph(matter.strip(), self.bullet_style))
+            self.story.append(Paragraph("Regulatory Matters", self.styles.h2))
+            self._append_bullets(legal_data['regulatory_summary'])
             self.story.append(Spacer(1, 12))
 
         if 'governance_summary' in legal_data:
-            self.story.append(Paragraph("Corporate Governance Commentary", self.h2_style))
-            for comment in legal_data['governance_summary'].split('\n\n'):
-                if comment.strip(): self.story.append(Paragraph(comment.strip(), self.bullet_style))
+            self.story.append(Paragraph("Corporate Governance Commentary", self.styles.h2))
+            self._append_bullets(legal_data['governance_summary'])
             self.story.append(Spacer(1, 12))
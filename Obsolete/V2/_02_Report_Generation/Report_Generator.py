@@ -1,9 +1,66 @@
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from PyPDF2 import PdfWriter
+import numpy as np
+import pandas as pd
 import os
+import tempfile
+from xml.sax.saxutils import escape
+
+# Font used for body cells; plain-string cells are measured against it
+CELL_FONT_NAME = 'Helvetica'
+CELL_FONT_SIZE = 7
+CELL_LEADING = 9
+
+# Font used for header cells
+HEADER_FONT_NAME = 'Helvetica-Bold'
+HEADER_FONT_SIZE = 8
+HEADER_LEADING = 10
+
+# Left plus right padding ReportLab applies to each table cell by default
+CELL_HORIZONTAL_PADDING = 12
+
+# Longest cell text rendered; longer text is cut short with an ellipsis so a stray
+# footnote cannot stall ReportLab's line breaking
+MAX_CELL_CHARS = 500
+
+# Narrowest width a content-sized column is given, in points
+MIN_COLUMN_WIDTH = 72
+
+# Tables with more body rows than this are built as LongTable, whose page splitting
+# scales better on tables that span many pages
+LONG_TABLE_MIN_ROWS = 50
+
+# Frames longer than this are split into separate tables by add_tables_bulk
+BULK_TABLE_MAX_ROWS = 100
+
+# Flowables held in the story before they are built into a partial PDF
+FLUSH_THRESHOLD = 50
+
+# Style shared by every single-frame table; ReportLab only reads it when applying
+_DEFAULT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 1), (-1, -1), CELL_FONT_NAME),
+    ('FONTSIZE', (0, 1), (-1, -1), CELL_FONT_SIZE),
+    ('LEADING', (0, 1), (-1, -1), CELL_LEADING),
+    ('FONTNAME', (0, 0), (-1, 0), HEADER_FONT_NAME),
+    ('FONTSIZE', (0, 0), (-1, 0), HEADER_FONT_SIZE),
+    ('LEADING', (0, 0), (-1, 0), HEADER_LEADING),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+])
 
 class ReportGenerator:
     def __init__(self, report_name: str, save_location: str):
@@ -25,21 +82,216 @@ class ReportGenerator:
         self.file_path = os.path.join(save_location, f"{report_name}.pdf")
         
         # Create PDF document using SimpleDocTemplate (better for tables)
-        self.doc = SimpleDocTemplate(
-            self.file_path,
+        self.doc = self._make_doc(self.file_path)
+        
+        # Initialize story (list of flowables to build the PDF)
+        self.story = []
+
+        # Partial PDFs already built from flushed parts of the story, in order
+        self._partial_files = []
+
+        # Create styles once; they are reused by every table
+        self.title_style = ParagraphStyle(
+            name='TitleStyle',
+            fontName='Helvetica',
+            fontSize=14,
+            leading=16,
+            alignment=1,  # Centered
+            spaceAfter=12
+        )
+
+        self.header_style = ParagraphStyle(
+            name='HeaderStyle',
+            fontSize=HEADER_FONT_SIZE,
+            fontName=HEADER_FONT_NAME,
+            textColor=colors.whitesmoke,
+            alignment=1,  # Center
+            leading=HEADER_LEADING
+        )
+
+        self.cell_style = ParagraphStyle(
+            name='CellStyle',
+            fontName=CELL_FONT_NAME,
+            fontSize=CELL_FONT_SIZE,
+            alignment=1,  # Center
+            leading=CELL_LEADING
+        )
+
+    @staticmethod
+    def _make_doc(file_path):
+        """
+        Creates the document template used for the report and its partial PDFs.
+
+        Args:
+            file_path (str): Path the document is built to.
+        """
+        return SimpleDocTemplate(
+            file_path,
             pagesize=letter,
             rightMargin=0.5*inch,
             leftMargin=0.5*inch,
             topMargin=0.75*inch,
             bottomMargin=0.5*inch
         )
-        
-        # Initialize styles for text elements
-        self.styles = getSampleStyleSheet()
-        
-        # Initialize story (list of flowables to build the PDF)
+
+    def _add_to_story(self, *flowables):
+        """
+        Appends flowables to the story, building it into a partial PDF once it holds
+        FLUSH_THRESHOLD flowables so memory stays bounded on large reports.
+        """
+        self.story.extend(flowables)
+        if len(self.story) >= FLUSH_THRESHOLD:
+            self._flush_story()
+
+    def _flush_story(self):
+        """Builds the current story into a temporary partial PDF and clears it."""
+        fd, partial_path = tempfile.mkstemp(suffix='.pdf', dir=self.save_location)
+        os.close(fd)
+        self._make_doc(partial_path).build(self.story)
+        self._partial_files.append(partial_path)
         self.story = []
 
+    def _make_cell(self, text, max_width, style):
+        """
+        Returns a cell's text as a plain string when it fits on one line, otherwise
+        as a Paragraph so ReportLab wraps it. Paragraph text is escaped first, so
+        characters such as '&' and '<' are shown as written rather than read as markup.
+
+        Args:
+            text (str): The cell text.
+            max_width (float): Width available for text inside the cell.
+            style (ParagraphStyle): Style of the cell; its font is also set on the
+                                    table for plain-string cells.
+        """
+        if '\n' not in text and stringWidth(text, style.fontName, style.fontSize) <= max_width:
+            return text
+        return Paragraph(escape(text), style)
+
+    @staticmethod
+    def _column_text(df):
+        """
+        Converts each column of a DataFrame to an array of cell strings.
+
+        Numeric, object and string columns are converted with NumPy's astype(str), one
+        C-level pass per column, rather than calling str() on every cell; datetime and
+        other extension dtypes still use str() so they read as pandas prints them.
+        Missing values become empty strings, and text longer than MAX_CELL_CHARS is
+        truncated with an ellipsis.
+
+        Args:
+            df (pd.DataFrame): DataFrame to be converted.
+
+        Returns:
+            list: One NumPy string array per column.
+        """
+        column_text = []
+        for j in range(len(df.columns)):
+            column = df.iloc[:, j]
+            dtype = column.dtype
+            if (isinstance(dtype, np.dtype) and dtype.kind not in 'mM') or isinstance(dtype, pd.StringDtype):
+                text = column.to_numpy().astype(str)
+            else:
+                # Datetime and extension dtypes (nullable Int64, categorical, ...) go through
+                # str() on each boxed value; NumPy would render them as ISO timestamps or floats
+                text = column.astype(object).map(str).to_numpy().astype(str)
+            # Blank out NaN/None instead of rendering 'nan' or 'None'
+            values = np.where(column.isna().to_numpy(), '', text)
+            too_long = np.char.str_len(values) > MAX_CELL_CHARS
+            if too_long.any():
+                # Casting to a narrower string dtype truncates every value in one pass
+                truncated = np.char.add(values.astype(f'<U{MAX_CELL_CHARS - 1}'), '…')
+                values = np.where(too_long, truncated, values)
+            column_text.append(values)
+        return column_text
+
+    def _column_layout(self, frame_texts):
+        """
+        Sizes table columns from their content.
+
+        Each column gets a share of the page width proportional to its widest cell,
+        never less than MIN_COLUMN_WIDTH (or an equal share of the page, if smaller). Columns whose cells all fit on one line at
+        that width are marked as not needing wrapping, so their cells skip Paragraph.
+
+        Args:
+            frame_texts (list): Column strings, as returned by _column_text, of each
+                                frame that will share the column layout; all must
+                                have the same number of columns.
+
+        Returns:
+            tuple: (col_widths, needs_wrap), one entry per column.
+        """
+        num_columns = len(frame_texts[0])
+        text_widths = [0.0] * num_columns
+        has_line_break = [False] * num_columns
+
+        for column_text in frame_texts:
+            for j, values in enumerate(column_text):
+                if len(values) == 0:
+                    continue
+                widest = max(stringWidth(value, CELL_FONT_NAME, CELL_FONT_SIZE) for value in values)
+                text_widths[j] = max(text_widths[j], widest)
+                has_line_break[j] = has_line_break[j] or any('\n' in value for value in values)
+
+        # Share the page width out in proportion to each column's natural width, never
+        # going below the floor. The floor shrinks to an equal share on frames too wide
+        # for MIN_COLUMN_WIDTH columns, so the widths always add up to the page width.
+        available_width = self.doc.width
+        natural_widths = [min(width + CELL_HORIZONTAL_PADDING, available_width) for width in text_widths]
+        min_width = min(MIN_COLUMN_WIDTH, available_width / num_columns)
+        col_widths = [min_width] * num_columns
+
+        # Columns whose proportional share would fall below the floor are pinned to it,
+        # and the rest of the width is shared out again among the others
+        flexible = set(range(num_columns))
+        while flexible:
+            remaining_width = available_width - min_width * (num_columns - len(flexible))
+            flexible_natural = sum(natural_widths[j] for j in flexible)
+            pinned = {j for j in flexible if natural_widths[j] * remaining_width / flexible_natural < min_width}
+            if not pinned:
+                for j in flexible:
+                    col_widths[j] = natural_widths[j] * remaining_width / flexible_natural
+                break
+            flexible -= pinned
+
+        needs_wrap = [
+            line_break or text_width > col_width - CELL_HORIZONTAL_PADDING
+            for line_break, text_width, col_width in zip(has_line_break, text_widths, col_widths)
+        ]
+        return col_widths, needs_wrap
+
+    def _table_rows(self, columns, column_text, col_widths, needs_wrap):
+        """
+        Builds a header row followed by the data rows of a table.
+
+        Header labels, and cells in columns that need wrapping, are wrapped in
+        Paragraph objects when they overflow; every other cell stays a plain string
+        and is styled through TableStyle font commands.
+
+        Args:
+            columns (pd.Index): Column labels for the header row.
+            column_text (list): Cell strings per column, as returned by _column_text.
+            col_widths (list): Width of each table column.
+            needs_wrap (list): Whether each column has cells that may need wrapping.
+
+        Returns:
+            list: List of rows, each a list of cells.
+        """
+        max_text_widths = [width - CELL_HORIZONTAL_PADDING for width in col_widths]
+
+        # Add headers; only labels too long for their column need a Paragraph
+        data = [[
+            self._make_cell(str(col), max_width, self.header_style)
+            for col, max_width in zip(columns, max_text_widths)
+        ]]
+
+        # Add data rows by zipping the column strings, so no Series is built per row
+        for row in zip(*(values.tolist() for values in column_text)):
+            data.append([
+                self._make_cell(text, max_width, self.cell_style) if wrap else text
+                for text, max_width, wrap in zip(row, max_text_widths, needs_wrap)
+            ])
+        return data
+
     def add_table_from_df(self, df, title=None):
         """
         Add a table to the PDF from a pandas DataFrame.
@@ -48,72 +300,304 @@ class ReportGenerator:
             df (pd.DataFrame): DataFrame to be converted into a table.
             title (str, optional): Title to be added above the table.
         """
+        column_text = self._column_text(df)
+        col_widths, needs_wrap = self._column_layout([column_text])
+        self._append_table(df.columns, column_text, title, col_widths, needs_wrap)
 
-        # Add title if provided
-        if title:
-            title_style = ParagraphStyle(
-                name='TitleStyle',
-                fontSize=14,
-                leading=16,
-                alignment=1,  # Centered
-                spaceAfter=12
-            )
-            self.story.append(Paragraph(title, title_style))
-        
-        # Calculate available width
-        available_width = self.doc.width
-        num_columns = len(df.columns)
-        col_width = available_width / num_columns
-        
-        # Create styles for wrapping text in cells
-        header_style = ParagraphStyle(
-            name='HeaderStyle',
-            fontSize=8,
-            fontName='Helvetica-Bold',
-            textColor=colors.whitesmoke,
-            alignment=1,  # Center
-            leading=10
-        )
-        
-        cell_style = ParagraphStyle(
-            name='CellStyle',
-            fontSize=7,
-            alignment=1,  # Center
-            leading=9
-        )
-        
-        # Convert DataFrame to list of lists with Paragraph objects for wrapping
-        data = []
-        
-        # Add headers as Paragraph objects
-        header_row = [Paragraph(str(col), header_style) for col in df.columns]
-        data.append(header_row)
-        
-        # Add data rows as Paragraph objects
-        for _, row in df.iterrows():
-            data_row = [Paragraph(str(val), cell_style) for val in row]
-            data.append(data_row)
+    def _append_table(self, columns, column_text, title, col_widths, needs_wrap):
+        """
+        Add a table to the story using the given column layout.
+
+        Args:
+            columns (pd.Index): Column labels for the header row.
+            column_text (list): Cell strings per column, as returned by _column_text.
+            title (str): Title to be added above the table, or None.
+            col_widths (list): Width of each table column.
+            needs_wrap (list): Whether each column has cells that may need wrapping.
+        """
+        data = self._table_rows(columns, column_text, col_widths, needs_wrap)
         
-        # Create Table with calculated column widths
-        table = Table(data, colWidths=[col_width]*num_columns, hAlign='LEFT', repeatRows=1)
+        # Create Table with the content-based column widths. The header repeat only costs
+        # anything when the table splits, and a table that starts mid-page can split even if
+        # it is shorter than a page, so it is always kept
+        table_class = LongTable if len(data) - 1 > LONG_TABLE_MIN_ROWS else Table
+        table = table_class(data, colWidths=col_widths, hAlign='LEFT', repeatRows=1)
         
         # Add style to the table
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_DEFAULT_TABLE_STYLE)
         
-        # Add table to the story
-        self.story.append(table)
-        self.story.append(Spacer(1, 12))  # Add space after the table
-    
+        # Add the title (if provided), table and space after it in one call, so a flush
+        # never separates a title from its table
+        flowables = [table, Spacer(1, 12)]
+        if title:
+            flowables.insert(0, Paragraph(title, self.title_style))
+        self._add_to_story(*flowables)
+
+    def add_tables_bulk(self, frames):
+        """
+        Add several DataFrames to the PDF, combining frames that share a column count
+        into a single table so ReportLab lays out fewer flowables.
+
+        Each frame in a combined table keeps its own header row, preceded by a section
+        row holding its title. Frames longer than BULK_TABLE_MAX_ROWS rows are split into
+        chunks that are added as separate tables instead.
+
+        Args:
+            frames (list): List of (DataFrame, title) tuples; title may be None.
+        """
+        # Group frames by column count, keeping the order in which counts first appear
+        groups = {}
+        for df, title in frames:
+            groups.setdefault(len(df.columns), []).append((df, title))
+
+        for num_columns, group in groups.items():
+            short_frames = [
+                (df.columns, self._column_text(df), title)
+                for df, title in group if len(df) <= BULK_TABLE_MAX_ROWS
+            ]
+            long_frames = [(df, title) for df, title in group if len(df) > BULK_TABLE_MAX_ROWS]
+
+            if short_frames:
+                col_widths, needs_wrap = self._column_layout([text for _, text, _ in short_frames])
+                data = []
+                style_commands = [
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('TOPPADDING', (0, 0), (-1, -1), 4),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+                    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                    ('FONTNAME', (0, 0), (-1, -1), CELL_FONT_NAME),
+                    ('FONTSIZE', (0, 0), (-1, -1), CELL_FONT_SIZE),
+                    ('LEADING', (0, 0), (-1, -1), CELL_LEADING),
+                ]
+
+                for columns, column_text, title in short_frames:
+                    if title:
+                        section_row = len(data)
+                        data.append([str(title)] + [''] * (num_columns - 1))
+                        style_commands += [
+                            ('SPAN', (0, section_row), (-1, section_row)),
+                            ('BACKGROUND', (0, section_row), (-1, section_row), colors.lightgrey),
+                            ('FONTNAME', (0, section_row), (-1, section_row), 'Helvetica-Bold'),
+                            ('FONTSIZE', (0, section_row), (-1, section_row), 10),
+                            ('LEADING', (0, section_row), (-1, section_row), 12),
+                        ]
+
+                    header_row = len(data)
+                    data.extend(self._table_rows(columns, column_text, col_widths, needs_wrap))
+                    style_commands += [
+                        ('BACKGROUND', (0, header_row), (-1, header_row), colors.grey),
+                        ('TOPPADDING', (0, header_row), (-1, header_row), 8),
+                        ('BOTTOMPADDING', (0, header_row), (-1, header_row), 8),
+                        ('FONTNAME', (0, header_row), (-1, header_row), HEADER_FONT_NAME),
+                        ('FONTSIZE', (0, header_row), (-1, header_row), HEADER_FONT_SIZE),
+                        ('LEADING', (0, header_row), (-1, header_row), HEADER_LEADING),
+                        ('TEXTCOLOR', (0, header_row), (-1, header_row), colors.whitesmoke),
+                    ]
+
+                table_class = LongTable if len(data) - 1 > LONG_TABLE_MIN_ROWS else Table
+                table = table_class(data, colWidths=col_widths, hAlign='LEFT')
+                table.setStyle(TableStyle(style_commands))
+                self._add_to_story(table, Spacer(1, 12))  # Add space after the table
+
+            # Split long frames into fixed-size chunks, each its own table with a repeated
+            # header; the layout is measured once per frame so every chunk lines up
+            for df, title in long_frames:
+                column_text = self._column_text(df)
+                col_widths, needs_wrap = self._column_layout([column_text])
+                for start in range(0, len(df), BULK_TABLE_MAX_ROWS):
+                    chunk_text = [values[start:start + BULK_TABLE_MAX_ROWS] for values in column_text]
+                    chunk_title = title if start == 0 else None
+                    self._append_table(df.columns, chunk_text, chunk_title, col_widths, needs_wrap)
+
     def save(self):
         """Build and save the PDF with all added content."""
-        self.doc.build(self.story)
+        if not self._partial_files:
+            self.doc.build(self.story)
+        else:
+            # Build what is left of the story, then join the partial PDFs in order
+            if self.story:
+                self._flush_story()
+            writer = PdfWriter()
+            for partial_path in self._partial_files:
+                writer.append(partial_path)
+            with open(self.file_path, 'wb') as f:
+                writer.write(f)
+            for partial_path in self._partial_files:
+                os.remove(partial_path)
+            self._partial_files = []
+        print(f"PDF report saved to: {self.file_path}")
+
+
+# ReportGenerator instances shared across calls, keyed by (report_name, save_location)
+_REPORT_CACHE = {}
+
+def get_report(report_name: str, save_location: str) -> ReportGenerator:
+    """
+    Returns the ReportGenerator for a report name and location, creating it on first use.
+
+    Reusing the instance keeps its document template and styles when the same report is
+    generated repeatedly from one session, for example from a notebook. Building the PDF
+    consumes the story, so each save() writes the tables added since the previous one.
+
+    Args:
+        report_name (str): Name of the report (will be used as filename).
+        save_location (str): Directory path where the PDF will be saved.
+    """
+    key = (report_name, save_location)
+    if key not in _REPORT_CACHE:
+        _REPORT_CACHE[key] = ReportGenerator(report_name, save_location)
+    return _REPORT_CACHE[key]
+
+
+def _wrap_text(text, font_name, font_size, max_width):
+    """
+    Splits text into lines no wider than max_width, breaking inside words that
+    are too long to fit on a line of their own.
+    """
+    lines = []
+    for line in simpleSplit(text, font_name, font_size, max_width) or ['']:
+        while len(line) > 1 and stringWidth(line, font_name, font_size) > max_width:
+            cut = len(line) - 1
+            while cut > 1 and stringWidth(line[:cut], font_name, font_size) > max_width:
+                cut -= 1
+            lines.append(line[:cut])
+            line = line[cut:]
+        lines.append(line)
+    return lines
+
+
+class FastReportGenerator(ReportGenerator):
+    """
+    Table-only report generator that draws rows straight onto a ReportLab canvas.
+
+    Skips Platypus' flowable layout: rows are emitted top to bottom, and a new page is
+    started, with the header row repeated, when the next row would cross the bottom
+    margin. Column widths, fonts and margins match ReportGenerator.
+    """
+
+    def __init__(self, report_name: str, save_location: str):
+        """
+        Initialize the FastReportGenerator and open a canvas for the PDF.
+
+        Args:
+            report_name (str): Name of the report (will be used as filename).
+            save_location (str): Directory path where the PDF will be saved.
+        """
+        super().__init__(report_name, save_location)
+        self.canvas = canvas.Canvas(self.file_path, pagesize=self.doc.pagesize)
+        self.top = self.doc.pagesize[1] - self.doc.topMargin
+        self.y = self.top
+
+    def _new_page(self):
+        """Finish the current page and move to the top of the next one."""
+        self.canvas.showPage()
+        self.y = self.top
+
+    def _draw_row(self, x_positions, col_widths, cells, style, padding, background=None):
+        """
+        Draw one table row at the current position and move below it.
+
+        Args:
+            x_positions (list): Left edge of each column.
+            col_widths (list): Width of each column.
+            cells (list): Lines of text in each cell.
+            style (ParagraphStyle): Font, size, leading and text color of the row.
+            padding (float): Space above and below the tallest cell.
+            background (Color, optional): Fill color of the row.
+        """
+        c = self.canvas
+        row_height = max(len(lines) for lines in cells) * style.leading + 2 * padding
+        bottom = self.y - row_height
+
+        if background is not None:
+            c.setFillColor(background)
+            c.rect(x_positions[0], bottom, sum(col_widths), row_height, stroke=0, fill=1)
+
+        c.setLineWidth(0.5)
+        c.setStrokeColor(colors.black)
+        c.setFillColor(style.textColor)
+        c.setFont(style.fontName, style.fontSize)
+        for x, width, lines in zip(x_positions, col_widths, cells):
+            c.rect(x, bottom, width, row_height, stroke=1, fill=0)
+            # Center the block of lines vertically, then each line horizontally
+            baseline = bottom + (row_height + len(lines) * style.leading) / 2 - style.fontSize
+            for line in lines:
+                c.drawCentredString(x + width / 2, baseline, line)
+                baseline -= style.leading
+
+        self.y = bottom
+
+    def add_table_from_df(self, df, title=None):
+        """
+        Draw a table on the canvas from a pandas DataFrame.
+
+        Args:
+            df (pd.DataFrame): DataFrame to be converted into a table.
+            title (str, optional): Title to be drawn above the table.
+        """
+        column_text = self._column_text(df)
+        col_widths, _ = self._column_layout([column_text])
+        x_positions = [self.doc.leftMargin]
+        for width in col_widths[:-1]:
+            x_positions.append(x_positions[-1] + width)
+        text_widths = [width - CELL_HORIZONTAL_PADDING for width in col_widths]
+
+        def split_cells(texts, style):
+            return [
+                _wrap_text(text, style.fontName, style.fontSize, text_width)
+                for text, text_width in zip(texts, text_widths)
+            ]
+
+        header_cells = split_cells([str(col) for col in df.columns], self.header_style)
+        header_height = max(len(lines) for lines in header_cells) * self.header_style.leading + 16
+
+        # Whether the current page holds nothing above this table's rows but its title and header
+        fresh_page = self.y == self.top
+
+        # Add title if provided, keeping it on the same page as the header row
+        if title:
+            title_height = self.title_style.leading + self.title_style.spaceAfter
+            if self.y - title_height - header_height < self.doc.bottomMargin:
+                self._new_page()
+                fresh_page = True
+            self.canvas.setFillColor(colors.black)
+            self.canvas.setFont(self.title_style.fontName, self.title_style.fontSize)
+            self.canvas.drawCentredString(
+                self.doc.leftMargin + self.doc.width / 2, self.y - self.title_style.fontSize, title
+            )
+            self.y -= title_height
+        elif self.y - header_height < self.doc.bottomMargin:
+            self._new_page()
+            fresh_page = True
+
+        self._draw_row(x_positions, col_widths, header_cells, self.header_style, 8, colors.grey)
+
+        for row in zip(*(values.tolist() for values in column_text)):
+            cells = split_cells(row, self.cell_style)
+            row_height = max(len(lines) for lines in cells) * self.cell_style.leading + 8
+            # Break unless the page already holds only the header; a row too tall for a fresh
+            # page is then drawn as is instead of starting a page with nothing but a header
+            if self.y - row_height < self.doc.bottomMargin and not fresh_page:
+                self._new_page()
+                self._draw_row(x_positions, col_widths, header_cells, self.header_style, 8, colors.grey)
+            self._draw_row(x_positions, col_widths, cells, self.cell_style, 4)
+            fresh_page = False
+
+        self.y -= 12  # Add space after the table
+
+    def add_tables_bulk(self, frames):
+        """
+        Draw several DataFrames as tables. Each frame is drawn as its own table, since
+        there is no flowable layout cost to save by combining them.
+
+        Args:
+            frames (list): List of (DataFrame, title) tuples; title may be None.
+        """
+        for df, title in frames:
+            self.add_table_from_df(df, title=title)
+
+    def save(self):
+        """Save the PDF with all drawn content."""
+        self.canvas.save()
         print(f"PDF report saved to: {self.file_path}")
@@ -1,11 +1,50 @@
 import os
+import pickle
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # This ensures that the script can find the modules in the '01_Data' directory
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from _01_Data_Analysis.Statement_Data import EdgarFinancials
-from _02_Report_Generation.Report_Generator import ReportGenerator
+from _02_Report_Generation.Report_Generator import get_report
+
+# Filings fetched at once; the work is SEC HTTP requests and Excel parsing
+MAX_FETCH_WORKERS = 8
+
+# Statements fetched from EDGAR are cached here, so reruns that only change the report skip the network
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.edgar_cache')
+
+def load_cached_statements(cache_key, fetch, refresh=False):
+    """
+    Returns the statements cached under cache_key, calling fetch() and caching its result on a miss.
+
+    Args:
+        cache_key (str): File-name-safe key identifying the request (ticker, form, count, statement types).
+        fetch (callable): Function that fetches the statements from EDGAR.
+        refresh (bool): Ignore any cached entry, fetch again and overwrite it.
+
+    Returns:
+        list: List of tuples (accession_number, statement_type, sheet_name, DataFrame).
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.pkl")
+    if not refresh and os.path.exists(cache_path):
+        print(f"Loading cached statements from {cache_path}")
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    statements = fetch()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(statements, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return statements
+
+def clear_statement_cache():
+    """Deletes every cached EDGAR request in CACHE_DIR."""
+    if os.path.isdir(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+        print(f"Cleared statement cache at {CACHE_DIR}")
 
 def main():
     """
@@ -16,26 +55,43 @@ def main():
     # It's good practice to use environment variables for this.
     EMAIL_FOR_SEC = "feb2126@columbia.edu"
     TICKER = "PPG"  # Example: NVIDIA Corporation
+    FILING_TYPE = "10-K"
+    FILING_COUNT = 1
+    # Set to True to fetch from EDGAR again instead of loading the cached statements
+    REFRESH_CACHE = False
+
+    # Define desired statement types to extract
+    statement_types = ['Income Statement', 'Balance Sheet', 'Cash Flow Statement']
 
-    print(f"Initializing EDGAR financials client for {TICKER}...")
-    # Create an instance of the EdgarFinancials class
-    edgar_client = EdgarFinancials(email=EMAIL_FOR_SEC, ticker=TICKER)
+    def fetch_statements():
+        print(f"Initializing EDGAR financials client for {TICKER}...")
+        # Create an instance of the EdgarFinancials class
+        edgar_client = EdgarFinancials(email=EMAIL_FOR_SEC, ticker=TICKER)
 
-    print(f"Fetching the most recent 5 10-K filings for {TICKER}...")
-    # Get the most recent 5 10-K filings
-    # This can take a moment as it's downloading data from the SEC.
-    latest_10ks = edgar_client.get_multiple_filings(filing_type='10-K', count=1)
+        print(f"Fetching the most recent {FILING_COUNT} {FILING_TYPE} filings for {TICKER}...")
+        # Get the most recent FILING_COUNT filings of FILING_TYPE
+        # This can take a moment as it's downloading data from the SEC.
+        latest_10ks = edgar_client.get_multiple_filings(filing_type=FILING_TYPE, count=FILING_COUNT)
 
-    print(f"Retrieved {len(latest_10ks)} 10-K filings")
+        print(f"Retrieved {len(latest_10ks)} {FILING_TYPE} filings")
 
-    # Define desired statement types to extract
-    statement_types = ['Income Statement', 'Balance Sheet', 'Cash Flow Statement']
-    
-    print(f"\nExtracting statement types: {statement_types}")
-    print("Fetching and processing financial statements using keyword matching...")
-    
-    # Get statements using get_statements_by_type with dynamic keyword matching
-    statements = edgar_client.get_statements_by_type(latest_10ks, statement_types)
+        print(f"\nExtracting statement types: {statement_types}")
+        print("Fetching and processing financial statements using keyword matching...")
+
+        # Get statements using get_statements_by_type with dynamic keyword matching, one filing
+        # per worker; map keeps the filings in their original order
+        def fetch_one(filing):
+            return edgar_client.get_statements_by_type([filing], statement_types)
+
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            return [
+                statement
+                for filing_statements in executor.map(fetch_one, latest_10ks)
+                for statement in filing_statements
+            ]
+
+    cache_key = f"{TICKER}_{FILING_TYPE}_{FILING_COUNT}_" + "_".join(t.replace(' ', '-') for t in statement_types)
+    statements = load_cached_statements(cache_key, fetch_statements, refresh=REFRESH_CACHE)
 
     print(f"\n{'='*80}")
     print(f"Successfully retrieved {len(statements)} statements")
@@ -43,13 +99,16 @@ def main():
 
     # Generate PDF report with tables
     output_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_03_Outputs')
-    report_gen = ReportGenerator(report_name='test', save_location=output_folder)
+    report_gen = get_report(report_name='test', save_location=output_folder)
     
     print("Generating PDF report with tables...")
     
-    # Add each statement as a table without titles
-    for accession_number, statement_type, sheet_name, df in statements:
-        report_gen.add_table_from_df(df, title=None)
+    # Convert each statement to a render-ready string frame in one vectorized pass; missing
+    # values become empty cells. Headers were already cleaned by get_statements_by_type.
+    frames = [(df.fillna('').astype(str), statement_type) for _, statement_type, _, df in statements]
+
+    # Add the statements in bulk, titled by statement type, so tables sharing a layout are combined
+    report_gen.add_tables_bulk(frames)
     
     # Save the final PDF
     report_gen.save()
@@ -1,4 +1,5 @@
 import edgar
+import requests
 
 
 class EdgarClient:
@@ -20,8 +21,13 @@ class EdgarClient:
         """
         edgar.set_identity(email)
         self.header = {'User-Agent': email}
+        # Shared session so repeated SEC requests reuse the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.header)
         self.company = edgar.Company(ticker)
         self.ticker = ticker
+        # Filings per form type, so repeated lookups skip the EDGAR round-trip
+        self._filings_cache = {}
 
     def get_multiple_filings(self, filing_type: str, count: int) -> list:
         """Gets multiple filings of a specified type for the company.
@@ -33,7 +39,10 @@ class EdgarClient:
         Returns:
             list: List of filing objects corresponding to the specified type and count.
         """
-        filings = self.company.get_filings(form=filing_type)
+        filings = self._filings_cache.get(filing_type)
+        if filings is None:
+            filings = self.company.get_filings(form=filing_type)
+            self._filings_cache[filing_type] = filings
         result = []
         for i in range(count):
             result.append(filings[i])
@@ -1,6 +1,7 @@
 import io
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Sequence
 
 import pandas as pd
 import requests
@@ -9,6 +10,47 @@ from src.services.edgar_client import EdgarClient
 from src.tools.statement_keywords import STATEMENT_KEYWORDS
 from src.utils.dataframe_utils import clean_dataframe_header
 
+# python-calamine lets pandas parse xlsx in Rust instead of pure-Python openpyxl;
+# fall back to openpyxl when it is not installed.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Chunk size used when streaming Financial_Report.xlsx downloads
+EXCEL_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class LazyExcelSheets(Sequence):
+    """Sequence of (sheet_name, DataFrame) tuples that parses each sheet on first access.
+
+    Statement extraction only needs the handful of sheets matched by keyword, so
+    the rest of the workbook is never converted to DataFrames.
+    """
+
+    def __init__(self, excel_file: pd.ExcelFile):
+        """Initializes the sequence.
+
+        Args:
+            excel_file (pd.ExcelFile): The opened workbook to read sheets from.
+        """
+        self._excel_file = excel_file
+        self._sheet_names = list(excel_file.sheet_names)
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self._sheet_names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        sheet_name = self._sheet_names[index]
+        if sheet_name not in self._cache:
+            self._cache[sheet_name] = self._excel_file.parse(sheet_name=sheet_name)
+        return sheet_name, self._cache[sheet_name]
+
 
 def find_statement_indices_by_keywords(client: EdgarClient, filing, statement_types: list) -> dict:
     """Find statement indices dynamically using keyword matching.
@@ -27,6 +69,9 @@ def find_statement_indices_by_keywords(client: EdgarClient, filing, statement_ty
 
     statements_df = reports_df[reports_df['MenuCategory'] == 'Statements'].copy()
 
+    # Lower-case the short names once instead of per row and per statement type
+    shortnames = list(zip(statements_df.index, statements_df['ShortName'].str.lower()))
+
     statement_indices = {}
 
     for statement_type in statement_types:
@@ -34,13 +79,14 @@ def find_statement_indices_by_keywords(client: EdgarClient, filing, statement_ty
             print(f"Warning: No keywords defined for '{statement_type}'")
             continue
 
-        keywords = STATEMENT_KEYWORDS[statement_type]
+        keywords = [keyword.lower() for keyword in STATEMENT_KEYWORDS[statement_type]]
 
-        for idx, row in statements_df.iterrows():
-            shortname = row['ShortName'].lower()
-            if any(keyword.lower() in shortname for keyword in keywords):
-                statement_indices[statement_type] = idx
-                break
+        idx = next(
+            (idx for idx, shortname in shortnames if any(keyword in shortname for keyword in keywords)),
+            None,
+        )
+        if idx is not None:
+            statement_indices[statement_type] = idx
 
     for statement_type in statement_types:
         if statement_type in STATEMENT_KEYWORDS and statement_type not in statement_indices:
@@ -49,16 +95,18 @@ def find_statement_indices_by_keywords(client: EdgarClient, filing, statement_ty
     return statement_indices
 
 
-def get_excel_from_filing(client: EdgarClient, filing) -> list:
-    """Retrieves the Excel file from a filing and returns a list of DataFrames per sheet.
+def get_excel_from_filing(client: EdgarClient, filing) -> Sequence:
+    """Retrieves the Excel file from a filing and returns its sheets as DataFrames.
+
+    Sheets are parsed lazily, the first time each one is accessed.
 
     Args:
         client (EdgarClient): The EDGAR client instance.
         filing: The filing object from which to extract the Excel file.
 
     Returns:
-        list: List of tuples (sheet_name, DataFrame) for each sheet in the Excel file,
-              or an empty list if the file is not available.
+        Sequence: Sequence of tuples (sheet_name, DataFrame) for each sheet in the Excel file,
+                  or an empty list if the file is not available.
     """
     accession_number = filing.accession_number
     cik = client.company.cik
@@ -67,17 +115,16 @@ def get_excel_from_filing(client: EdgarClient, filing) -> list:
     excel_file_link = f"{base_link}/Financial_Report.xlsx"
 
     try:
-        response = requests.get(excel_file_link, headers=client.header)
-        response.raise_for_status()
-
-        excel_file = pd.ExcelFile(io.BytesIO(response.content))
-
-        dataframes = []
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            dataframes.append((sheet_name, df))
+        # Stream the workbook into the buffer in chunks rather than holding the full
+        # response body and a BytesIO copy of it at the same time
+        excel_buffer = io.BytesIO()
+        with client.session.get(excel_file_link, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=EXCEL_DOWNLOAD_CHUNK_SIZE):
+                excel_buffer.write(chunk)
+        excel_buffer.seek(0)
 
-        return dataframes
+        return LazyExcelSheets(pd.ExcelFile(excel_buffer, engine=EXCEL_ENGINE))
     except requests.exceptions.HTTPError as e:
         print(
             f"Could not retrieve Excel file. It may not exist for this filing "
@@ -104,7 +151,7 @@ def get_statement_html_files(client: EdgarClient, filing, statement_types: list)
     filing_summary_link = f"{base_link}/FilingSummary.xml"
 
     try:
-        response = requests.get(filing_summary_link, headers=client.header)
+        response = client.session.get(filing_summary_link)
         response.raise_for_status()
         root = ET.fromstring(response.content)
     except (requests.exceptions.RequestException, ET.ParseError) as e:
@@ -158,7 +205,7 @@ def get_statements_from_html(client: EdgarClient, filing, statement_types: list)
         statement_link = f"{base_link}/{html_file_name}"
 
         try:
-            response = requests.get(statement_link, headers=client.header)
+            response = client.session.get(statement_link)
             response.raise_for_status()
             tables = pd.read_html(io.StringIO(response.text))
             candidate_tables = [t for t in tables if t.shape[0] > 3 and t.shape[1] > 1]
@@ -1,5 +1,11 @@
+import re
+
+import numpy as np
 import pandas as pd
 
+# Runs of whitespace collapsed to a single space in cleaned headers
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 def clean_dataframe_header(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -13,28 +19,34 @@ def clean_dataframe_header(df: pd.DataFrame) -> pd.DataFrame:
         df (pd.DataFrame): The input DataFrame to clean.
 
     Returns:
-        pd.DataFrame: A new DataFrame with cleaned headers and data.
+        pd.DataFrame: A new DataFrame with cleaned headers and data, or the input
+                      DataFrame itself if its header needs no cleaning.
     """
+    if not df.columns.astype(str).str.contains('Unnamed:', regex=False).any():
+        return df
+
+    # Pull the first row once as a plain array; later reads are ndarray indexing
+    first_row = df.iloc[0].to_numpy(dtype=object)
+    first_row_missing = pd.isna(first_row)
+    if first_row_missing.all():
+        return df
+
     df_copy = df.copy()
 
-    if any('Unnamed:' in str(col) for col in df_copy.columns) and not df_copy.iloc[0].isnull().all():
-        new_headers = []
-        first_row = df_copy.iloc[0].fillna('')
-        for i, col in enumerate(df_copy.columns):
-            col_name = str(col)
-            if 'Unnamed:' in col_name:
-                new_headers.append(str(first_row.iloc[i]))
-            else:
-                new_headers.append(f"{col_name} {first_row.iloc[i]}".strip())
-        df_copy.columns = new_headers
-
-        df_copy.columns = df_copy.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
-
-        if len(df_copy.columns) > 1:
-            second_col_val = str(df.iloc[0, 1]) if pd.notna(df.iloc[0, 1]) else ''
-            if second_col_val and second_col_val in df_copy.columns[0]:
-                df_copy.columns.values[0] = df_copy.columns[0].split(second_col_val)[0].strip()
-
-        df_copy = df_copy.iloc[1:].reset_index(drop=True)
+    # Placeholder columns take the first-row value; named columns get it appended
+    col_names = df_copy.columns.to_numpy(dtype=str)
+    first_row_str = np.where(first_row_missing, '', first_row.astype(str)).astype(str)
+    is_unnamed = np.char.find(col_names, 'Unnamed:') >= 0
+    joined = np.char.strip(np.char.add(np.char.add(col_names, ' '), first_row_str))
+    df_copy.columns = np.where(is_unnamed, first_row_str, joined)
+
+    df_copy.columns = df_copy.columns.str.strip().str.replace(_WHITESPACE_RE, ' ', regex=True)
+
+    if len(df_copy.columns) > 1:
+        second_col_val = '' if first_row_missing[1] else str(first_row[1])
+        if second_col_val and second_col_val in df_copy.columns[0]:
+            df_copy.columns.values[0] = df_copy.columns[0].split(second_col_val)[0].strip()
+
+    df_copy = df_copy.iloc[1:].reset_index(drop=True)
 
     return df_copy